@@ -20,18 +20,102 @@ Revolutionary Approach:
 - Universal formatting intelligence
 """
 
-from typing import Dict, Any, List, Optional, Tuple, Set
+from typing import Callable, Dict, Any, List, Optional, Tuple, Set
 from enum import Enum
 import asyncio
+import copy
+import hashlib
+import io
+import os
 import numpy as np
 import re
-from collections import defaultdict, Counter
-from dataclasses import dataclass
+from collections import defaultdict, Counter, OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 
-from ..models.document import ParsedDocument, PageInfo
+from ..models.document import ParsedDocument
 from ..models.enums import DocumentType
 from ..intelligence.embeddings import EmbeddingService
 
+# Optional SIMD similarity kernels
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
+
+# Precompiled line patterns
+_RE_NUMBERED = re.compile(r'^\d+\.')
+_RE_BULLET = re.compile(r'^[•\-\*]')
+_RE_HEADER_CAPS = re.compile(r'^[A-Z][A-Z\s]{5,}')
+_RE_LIST_START = re.compile(r'^[•\-\*\d]')
+
+# Numbered/bullet line starts anywhere in a page (for structural fingerprints)
+_RE_NUMBERED_LINE = re.compile(r'^[ \t]*\d+\.', re.MULTILINE)
+_RE_BULLET_LINE = re.compile(r'^[ \t]*[•\-\*]', re.MULTILINE)
+
+# Paragraph marker bits (packed into DocumentPattern.marker_bits)
+_MARKER_HEADER_CAPS = 1 << 0
+_MARKER_SECTION_HEADER = 1 << 1
+_MARKER_NUMBERED_LIST = 1 << 2
+_MARKER_BULLET_LIST = 1 << 3
+_MARKER_BITS = {
+    'header_caps': _MARKER_HEADER_CAPS,
+    'section_header': _MARKER_SECTION_HEADER,
+    'numbered_list': _MARKER_NUMBERED_LIST,
+    'bullet_list': _MARKER_BULLET_LIST,
+}
+_STRUCTURED_MARKERS = _MARKER_BULLET_LIST | _MARKER_NUMBERED_LIST | _MARKER_HEADER_CAPS
+
+# Line type codes used by mixed-content reconstruction
+_LINE_EMPTY = 0
+_LINE_FLOWING = 1
+_LINE_STRUCTURED = 2
+
+
+# Paragraph-break predicates for each learned marker
+_BREAK_PREDICATES: Dict[str, Callable[[str], bool]] = {
+    'header_caps': lambda line: line.isupper() and len(line) < 50,
+    'section_header': lambda line: line.endswith(':'),
+    'numbered_list': lambda line: _RE_NUMBERED.match(line) is not None,
+    'bullet_list': lambda line: _RE_BULLET.match(line) is not None,
+}
+
+
+def _never_break(line: str) -> bool:
+    return False
+
+
+def _compile_break_fn(paragraph_markers: List[str]) -> Callable[[str], bool]:
+    """
+    Specialize the paragraph-break test for a document's learned markers
+    
+    Markers arrive ordered by frequency (most common first), so the hottest
+    predicate is tried first and unused markers cost nothing per line.
+    """
+    predicates = tuple(
+        _BREAK_PREDICATES[marker] for marker in paragraph_markers if marker in _BREAK_PREDICATES
+    )
+    
+    if not predicates:
+        return _never_break
+    if len(predicates) == 1:
+        return predicates[0]
+    
+    def is_break(line: str) -> bool:
+        for predicate in predicates:
+            if predicate(line):
+                return True
+        return False
+    
+    return is_break
+
+
+def _stripped_nonempty_lines(text: str) -> List[str]:
+    """Split text into stripped, non-empty lines using C-level string routines"""
+    return [line for line in map(str.strip, text.splitlines()) if line]
+
 
 @dataclass
 class DocumentPattern:
@@ -43,6 +127,16 @@ class DocumentPattern:
     density_clusters: List[Tuple[int, float]]  # (page, density)
     semantic_breaks: List[Tuple[int, float]]  # (position, confidence)
     formatting_cues: Dict[str, Any]
+    marker_bits: int = field(init=False, repr=False, default=0)  # packed paragraph_markers
+    is_paragraph_break: Callable[[str], bool] = field(
+        init=False, repr=False, compare=False, default=_never_break
+    )
+    
+    def __post_init__(self):
+        self.marker_bits = 0
+        for marker in self.paragraph_markers:
+            self.marker_bits |= _MARKER_BITS.get(marker, 0)
+        self.is_paragraph_break = _compile_break_fn(self.paragraph_markers)
 
 
 @dataclass
@@ -56,6 +150,12 @@ class ExtractionStrategy:
     section_rules: Dict[str, Any]
 
 
+# Embeddings of previously seen page prefixes, shared by all detectors
+# (exact-match, keyed by a 128-bit hash of the model path and text)
+_PREFIX_CACHE_SIZE = 100_000
+_PREFIX_CACHE: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+
+
 class UniversalPatternDetector:
     """
     Universal pattern detection using Nomic embeddings
@@ -71,6 +171,22 @@ class UniversalPatternDetector:
         self.similarity_threshold = 0.7  # Will be dynamically adjusted
         self.flow_threshold = 0.5
         self.density_threshold = 0.3
+        
+        # Semantic sampling budget (characters sent to the embedder per document)
+        self.max_sample_pages = 50
+        self.max_page_chars = 1000
+        self.max_embed_chars = 32_000
+        
+        # Namespace for the shared prefix cache, so different models never share vectors
+        config = getattr(embeddings, "config", None) or {}
+        self._cache_namespace = str(config.get("model_path", "")).encode() + b"\0"
+        
+        # Concurrent embedding sub-batches (bounded to avoid flooding the embedder)
+        self.max_embed_batches = 4
+        self.min_embed_batch_size = 8
+        
+        # Paragraphs sampled before the dominant marker set is considered stable
+        self.marker_sample_limit = 10_000
     
     async def discover_document_patterns(self, document: ParsedDocument) -> DocumentPattern:
         """
@@ -82,20 +198,25 @@ class UniversalPatternDetector:
         if not document.pages:
             return self._create_default_pattern()
         
-        # 1. Analyze text flow patterns using embeddings
-        flow_patterns = await self._analyze_text_flow_patterns(document)
-        
-        # 2. Discover semantic boundaries using embedding similarity
-        semantic_boundaries = await self._discover_semantic_boundaries(document)
-        
-        # 3. Detect natural paragraph markers through clustering
-        paragraph_markers = await self._detect_paragraph_markers(document)
-        
-        # 4. Analyze content density patterns
-        density_patterns = self._analyze_density_patterns(document)
-        
-        # 5. Learn formatting cues from text structure
-        formatting_cues = self._learn_formatting_cues(document)
+        # 1. Discover semantic boundaries using embedding similarity
+        #    (started first so the embedding round-trip overlaps the CPU-only analyses)
+        semantic_task = asyncio.create_task(self._discover_semantic_boundaries(document))
+        
+        # 2-5. CPU-only analyses run on a worker thread so the event loop stays free
+        #      to drive the embedding task concurrently
+        try:
+            (
+                flow_patterns,
+                paragraph_markers,
+                density_patterns,
+                formatting_cues,
+            ) = await asyncio.to_thread(self._analyze_structure, document)
+        except BaseException:
+            # Don't leave the embedding task running (or its error unretrieved)
+            semantic_task.cancel()
+            raise
+        
+        semantic_boundaries = await semantic_task
         
         return DocumentPattern(
             avg_line_length=flow_patterns["avg_line_length"],
@@ -107,32 +228,46 @@ class UniversalPatternDetector:
             formatting_cues=formatting_cues
         )
     
-    async def _analyze_text_flow_patterns(self, document: ParsedDocument) -> Dict[str, Any]:
+    def _analyze_structure(
+        self,
+        document: ParsedDocument
+    ) -> Tuple[Dict[str, Any], List[str], List[Tuple[int, float]], Dict[str, Any]]:
+        """Run the CPU-only pattern analyses (no embedding calls)"""
+        
+        # 2. Analyze text flow patterns
+        flow_patterns = self._analyze_text_flow_patterns(document)
+        
+        # 3. Detect natural paragraph markers through clustering
+        paragraph_markers = self._detect_paragraph_markers(document)
+        
+        # 4. Analyze content density patterns
+        density_patterns = self._analyze_density_patterns(document)
+        
+        # 5. Learn formatting cues from text structure
+        formatting_cues = self._learn_formatting_cues(document)
+        
+        return flow_patterns, paragraph_markers, density_patterns, formatting_cues
+    
+    def _analyze_text_flow_patterns(self, document: ParsedDocument) -> Dict[str, Any]:
         """Analyze text flow patterns using AI embeddings"""
         
-        all_lines: List[str] = []
-        line_lengths: List[int] = []
+        line_lengths = np.fromiter(
+            (len(line) for page in document.pages for line in _stripped_nonempty_lines(page.text)),
+            dtype=np.int32
+        )
         
-        for page in document.pages:
-            lines = page.text.split('\n')
-            for line in lines:
-                clean_line = line.strip()
-                if clean_line:
-                    all_lines.append(clean_line)
-                    line_lengths.append(len(clean_line))
-        
-        if not line_lengths:
+        if not line_lengths.size:
             return {"avg_line_length": 0, "flow_type": "empty"}
         
-        avg_length = np.mean(line_lengths)
-        std_length = np.std(line_lengths)
+        avg_length = line_lengths.mean()
+        std_length = line_lengths.std()
         
         # Analyze line length distribution to determine flow type
-        short_lines = sum(1 for length in line_lengths if length < avg_length * 0.5)
-        medium_lines = sum(1 for length in line_lengths if avg_length * 0.5 <= length <= avg_length * 1.5)
-        long_lines = sum(1 for length in line_lengths if length > avg_length * 1.5)
+        short_lines = int(np.count_nonzero(line_lengths < avg_length * 0.5))
+        long_lines = int(np.count_nonzero(line_lengths > avg_length * 1.5))
+        medium_lines = line_lengths.size - short_lines - long_lines
         
-        total_lines = len(line_lengths)
+        total_lines = line_lengths.size
         
         # Determine flow type based on distribution
         if short_lines > total_lines * 0.4:
@@ -159,41 +294,130 @@ class UniversalPatternDetector:
         if len(document.pages) < 2:
             return []
         
-        # Sample pages for semantic analysis (efficient for large documents)
-        sample_size = min(50, len(document.pages))
+        # Sample pages for semantic analysis within a fixed character budget,
+        # so embedding cost stays bounded regardless of page count or size
+        sample_size = min(
+            self.max_sample_pages,
+            len(document.pages),
+            max(2, self.max_embed_chars // self.max_page_chars)
+        )
         step = max(1, len(document.pages) // sample_size)
-        sampled_pages = document.pages[::step][:sample_size]
         
-        # Get embeddings for semantic analysis
-        page_texts = [page.text for page in sampled_pages if page.text.strip()]
+        prefixes: List[str] = []
+        sampled_indices: List[int] = []
+        remaining_chars = self.max_embed_chars
+        
+        for page_idx in range(0, len(document.pages), step):
+            text = document.pages[page_idx].text
+            if not text or text.isspace():
+                continue
+            
+            prefix = text[:self.max_page_chars]
+            if len(prefix) > remaining_chars:
+                break
+            
+            remaining_chars -= len(prefix)
+            prefixes.append(prefix)
+            sampled_indices.append(page_idx)
+            
+            if len(prefixes) >= sample_size:
+                break
         
-        if len(page_texts) < 2:
+        if len(prefixes) < 2:
             return []
         
+        # Embed each distinct prefix once - repeated boilerplate pages share a vector
+        unique_prefixes: Dict[str, int] = {}
+        positions = [unique_prefixes.setdefault(prefix, len(unique_prefixes)) for prefix in prefixes]
+        
         # Use task-specific prefix for section analysis
-        prefixed_texts = [f"document_section: {text[:1000]}" for text in page_texts]
-        embeddings = await self.embeddings.embed_batch(prefixed_texts)
+        prefixed_texts = [f"document_section: {prefix}" for prefix in unique_prefixes]
+        embeddings = await self._embed_with_cache(prefixed_texts)
         
         # Find semantic breaks using embedding similarity
-        boundaries: List[int] = []
+        matrix = self._embeddings_to_matrix(embeddings)[positions]
+        similarities = self._adjacent_similarities(matrix)
         
-        for i in range(len(embeddings) - 1):
-            similarity = np.dot(embeddings[i], embeddings[i + 1])
-            
-            # Adaptive threshold - lower similarity indicates topic change
-            if similarity < self.similarity_threshold:
-                # Map back to original page indices
-                original_page_idx = (i + 1) * step
-                if original_page_idx < len(document.pages):
-                    boundaries.append(original_page_idx)
+        # Adaptive threshold - lower similarity indicates topic change
+        breaks = np.flatnonzero(similarities < self.similarity_threshold)
+        
+        # Map back to original page indices
+        boundaries = [sampled_indices[int(i) + 1] for i in breaks]
         
         return boundaries
     
-    async def _detect_paragraph_markers(self, document: ParsedDocument) -> List[str]:
+    async def _embed_with_cache(self, texts: List[str]) -> np.ndarray:
+        """Embed texts, only sending prefixes not seen in earlier documents"""
+        
+        namespace = self._cache_namespace
+        keys = [hashlib.blake2b(namespace + text.encode(), digest_size=16).digest() for text in texts]
+        vectors: List[Optional[np.ndarray]] = []
+        misses: List[int] = []
+        
+        for i, key in enumerate(keys):
+            vector = _PREFIX_CACHE.get(key)
+            if vector is None:
+                misses.append(i)
+            else:
+                _PREFIX_CACHE.move_to_end(key)
+            vectors.append(vector)
+        
+        if misses:
+            fresh = await self._embed_concurrently([texts[i] for i in misses])
+            for i, vector in zip(misses, fresh):
+                # Own float32 copy, so a cached row doesn't pin the whole batch array
+                vector = np.array(vector, dtype=np.float32)
+                vectors[i] = vector
+                _PREFIX_CACHE[keys[i]] = vector
+            
+            # Evict oldest entries beyond capacity
+            while len(_PREFIX_CACHE) > _PREFIX_CACHE_SIZE:
+                _PREFIX_CACHE.popitem(last=False)
+        
+        return np.stack(vectors)
+    
+    async def _embed_concurrently(self, texts: List[str]) -> np.ndarray:
+        """Embed texts as a few concurrent sub-batches instead of one blocking call"""
+        
+        n_batches = max(1, min(self.max_embed_batches, len(texts) // self.min_embed_batch_size))
+        if n_batches == 1:
+            return np.asarray(await self.embeddings.embed_batch(texts))
+        
+        # At most max_embed_batches sub-batches, so all of them can run at once
+        chunk = -(-len(texts) // n_batches)  # ceil division
+        
+        async def embed_chunk(start: int) -> np.ndarray:
+            return np.asarray(await self.embeddings.embed_batch(texts[start:start + chunk]))
+        
+        results = await asyncio.gather(*(embed_chunk(i) for i in range(0, len(texts), chunk)))
+        return np.concatenate(results, axis=0)
+    
+    def _embeddings_to_matrix(self, embeddings: Any) -> np.ndarray:
+        """Stack embeddings into a contiguous, L2-normalized (N, D) matrix"""
+        
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        
+        # Normalize once so cosine similarity reduces to a dot product
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.maximum(norms, 1e-12)
+        
+        return np.ascontiguousarray(matrix)
+    
+    def _adjacent_similarities(self, matrix: np.ndarray) -> np.ndarray:
+        """Cosine similarity between each row and the next one"""
+        
+        if SIMSIMD_AVAILABLE:
+            # Row-wise batched cosine distance in a single SIMD kernel call
+            distances = np.asarray(simsimd.cosine(matrix[:-1], matrix[1:]), dtype=np.float32)
+            return 1.0 - distances
+        
+        return np.einsum('ij,ij->i', matrix[:-1], matrix[1:], dtype=np.float32)
+    
+    def _detect_paragraph_markers(self, document: ParsedDocument) -> List[str]:
         """Detect natural paragraph markers through pattern analysis"""
         
-        # Collect all potential paragraph markers
-        marker_candidates: List[str] = []
+        # Count potential paragraph markers as they are found
+        marker_counts: Counter = Counter()
         
         for page in document.pages:
             text = page.text
@@ -202,24 +426,28 @@ class UniversalPatternDetector:
             paragraphs = text.split('\n\n')
             
             for para in paragraphs:
-                if para.strip():
-                    # Check first few characters for patterns
-                    first_chars = para.strip()[:20]
-                    
-                    # Common markers (not hard-coded, discovered from data)
-                    if re.match(r'^\d+\.', first_chars):  # Numbered lists
-                        marker_candidates.append('numbered_list')
-                    elif re.match(r'^[•\-\*]', first_chars):  # Bullet points
-                        marker_candidates.append('bullet_list')
-                    elif re.match(r'^[A-Z][A-Z\s]{5,}', first_chars):  # Headers (all caps)
-                        marker_candidates.append('header_caps')
-                    elif len(first_chars) < 50 and first_chars.endswith(':'):  # Section headers
-                        marker_candidates.append('section_header')
-                    else:
-                        marker_candidates.append('paragraph')
+                # Check first few characters for patterns
+                first_chars = para.strip()[:20]
+                if not first_chars:
+                    continue
+                
+                # Common markers (not hard-coded, discovered from data)
+                if _RE_NUMBERED.match(first_chars):  # Numbered lists
+                    marker_counts['numbered_list'] += 1
+                elif _RE_BULLET.match(first_chars):  # Bullet points
+                    marker_counts['bullet_list'] += 1
+                elif _RE_HEADER_CAPS.match(first_chars):  # Headers (all caps)
+                    marker_counts['header_caps'] += 1
+                elif len(first_chars) < 50 and first_chars.endswith(':'):  # Section headers
+                    marker_counts['section_header'] += 1
+                else:
+                    marker_counts['paragraph'] += 1
+            
+            # The dominant markers stabilize quickly - stop sampling large documents early
+            if marker_counts.total() > self.marker_sample_limit:
+                break
         
         # Find most common patterns
-        marker_counts = Counter(marker_candidates)
         dominant_markers = [marker for marker, count in marker_counts.most_common(5)]
         
         return dominant_markers
@@ -231,14 +459,15 @@ class UniversalPatternDetector:
         
         for i, page in enumerate(document.pages):
             # Calculate various density metrics
-            text = page.text.strip()
-            if not text:
+            # (on the raw text - stripping would copy the page for a negligible difference)
+            text = page.text
+            if not text or text.isspace():
                 density = 0.0
             else:
-                # Composite density score
+                # Composite density score (str.count avoids allocating split lists)
                 char_density = len(text)
-                word_density = len(text.split())
-                line_density = len(text.split('\n'))
+                line_density = text.count('\n') + 1
+                word_density = text.count(' ') + line_density  # word-count proxy
                 
                 # Normalized density (higher = more content)
                 density = (char_density * 0.5 + word_density * 0.3 + line_density * 0.2) / 1000
@@ -258,31 +487,39 @@ class UniversalPatternDetector:
             "spacing_patterns": {}
         }
         
-        all_lines = []
-        for page in document.pages:
-            all_lines.extend(page.text.split('\n'))
-        
-        # Analyze indentation patterns
-        indented_lines = [line for line in all_lines if line.startswith('  ') or line.startswith('\t')]
-        if len(indented_lines) > len(all_lines) * 0.1:
-            cues["indentation_style"] = "structured"
-        
-        # Find list indicators
+        # Single fused pass over every line with running counters
+        total_lines = 0
+        indented_lines = 0
+        empty_line_count = 0
         list_indicators = set()
-        for line in all_lines:
-            stripped = line.strip()
-            if stripped:
+        
+        for page in document.pages:
+            for line in page.text.splitlines():
+                total_lines += 1
+                
+                # Indentation patterns
+                if line.startswith(('  ', '\t')):
+                    indented_lines += 1
+                
+                stripped = line.strip()
+                if not stripped:
+                    empty_line_count += 1
+                    continue
+                
+                # List indicators
                 first_char = stripped[0]
                 if first_char in '•-*':
                     list_indicators.add(first_char)
-                elif re.match(r'^\d+\.', stripped):
+                elif _RE_NUMBERED.match(stripped):
                     list_indicators.add('numbered')
         
+        if indented_lines > total_lines * 0.1:
+            cues["indentation_style"] = "structured"
+        
         cues["list_indicators"] = list(list_indicators)
         
         # Analyze spacing patterns
-        empty_line_count = sum(1 for line in all_lines if not line.strip())
-        cues["spacing_patterns"]["empty_line_ratio"] = empty_line_count / len(all_lines) if all_lines else 0
+        cues["spacing_patterns"]["empty_line_ratio"] = empty_line_count / total_lines if total_lines else 0
         
         return cues
     
@@ -306,8 +543,12 @@ class AdaptiveTextFlowReconstructor:
     Uses AI-discovered patterns to improve text flow without hard-coding
     """
     
-    def __init__(self):
+    def __init__(self, executor: Optional[Executor] = None):
         self.confidence_threshold = 0.6
+        
+        # Optional worker pool for reconstructing pages concurrently
+        self.executor = executor
+        self.parallel_page_threshold = 8  # Below this, dispatch overhead outweighs the gain
     
     async def reconstruct_text_flow(
         self, 
@@ -323,39 +564,36 @@ class AdaptiveTextFlowReconstructor:
         if patterns.text_flow_type == "empty":
             return document
         
-        enhanced_pages = []
-        
-        for page in document.pages:
-            if patterns.text_flow_type == "flowing":
-                enhanced_text = await self._reconstruct_flowing_text(page.text, patterns)
-            elif patterns.text_flow_type == "structured":
-                enhanced_text = await self._reconstruct_structured_text(page.text, patterns)
-            else:  # mixed
-                enhanced_text = await self._reconstruct_mixed_text(page.text, patterns)
-            
-            # Create enhanced page
-            enhanced_page = PageInfo(
-                page_number=page.page_number,
-                text=enhanced_text,
-                width=page.width,
-                height=page.height
-            )
-            enhanced_pages.append(enhanced_page)
-        
-        # Update document with enhanced pages
-        document.pages = enhanced_pages
+        if patterns.text_flow_type == "flowing":
+            reconstruct = self._reconstruct_flowing_text
+        elif patterns.text_flow_type == "structured":
+            reconstruct = self._reconstruct_structured_text
+        else:  # mixed
+            reconstruct = self._reconstruct_mixed_text
+        
+        if self.executor is not None and len(document.pages) > self.parallel_page_threshold:
+            loop = asyncio.get_running_loop()
+            enhanced_texts = await asyncio.gather(*(
+                loop.run_in_executor(self.executor, reconstruct, page.text, patterns)
+                for page in document.pages
+            ))
+        else:
+            enhanced_texts = [reconstruct(page.text, patterns) for page in document.pages]
         
-        # Regenerate full text
-        document.text = "\n\n".join(page.text for page in enhanced_pages if page.text)
+        # Only the text changes - update the pages in place
+        # (document.text is regenerated once by the orchestrator after all page rewrites)
+        for page, enhanced_text in zip(document.pages, enhanced_texts):
+            page.text = enhanced_text
         
         return document
     
-    async def _reconstruct_flowing_text(self, text: str, patterns: DocumentPattern) -> str:
+    def _reconstruct_flowing_text(self, text: str, patterns: DocumentPattern) -> str:
         """Reconstruct flowing text (paragraph-based content)"""
         
-        lines = text.split('\n')
+        lines = text.splitlines()
         reconstructed_lines = []
         current_paragraph = []
+        is_paragraph_break = patterns.is_paragraph_break
         
         for line in lines:
             stripped = line.strip()
@@ -366,7 +604,7 @@ class AdaptiveTextFlowReconstructor:
                     reconstructed_lines.append(' '.join(current_paragraph))
                     current_paragraph = []
                 reconstructed_lines.append('')
-            elif self._is_paragraph_break(stripped, patterns):
+            elif is_paragraph_break(stripped):
                 # Natural paragraph break
                 if current_paragraph:
                     reconstructed_lines.append(' '.join(current_paragraph))
@@ -382,10 +620,10 @@ class AdaptiveTextFlowReconstructor:
         
         return '\n'.join(reconstructed_lines)
     
-    async def _reconstruct_structured_text(self, text: str, patterns: DocumentPattern) -> str:
+    def _reconstruct_structured_text(self, text: str, patterns: DocumentPattern) -> str:
         """Reconstruct structured text (lists, headers, etc.)"""
         
-        lines = text.split('\n')
+        lines = text.splitlines()
         reconstructed_lines = []
         
         for line in lines:
@@ -400,83 +638,67 @@ class AdaptiveTextFlowReconstructor:
         
         return '\n'.join(reconstructed_lines)
     
-    async def _reconstruct_mixed_text(self, text: str, patterns: DocumentPattern) -> str:
+    def _reconstruct_mixed_text(self, text: str, patterns: DocumentPattern) -> str:
         """Reconstruct mixed content using adaptive approach"""
         
-        lines = text.split('\n')
-        reconstructed_lines = []
-        current_section = []
-        section_type = None
-        
-        for line in lines:
-            stripped = line.strip()
+        lines = list(map(str.strip, text.splitlines()))
+        line_types = self._classify_lines(lines, patterns)
+        # Lines are written straight to the output; a run of flowing lines is
+        # collapsed in place once it ends (empty and structured lines end runs)
+        reconstructed_lines: List[str] = []
+        flow_start = -1
+        
+        for line_type, line in zip(line_types, lines):
+            if line_type == _LINE_FLOWING:
+                if flow_start < 0:
+                    flow_start = len(reconstructed_lines)
+            elif flow_start >= 0:
+                reconstructed_lines[flow_start:] = [' '.join(reconstructed_lines[flow_start:])]
+                flow_start = -1
             
-            if not stripped:
-                # Process current section
-                if current_section:
-                    if section_type == "flowing":
-                        # Join flowing text
-                        reconstructed_lines.append(' '.join(current_section))
-                    else:
-                        # Keep structured text separate
-                        reconstructed_lines.extend(current_section)
-                    current_section = []
-                    section_type = None
-                reconstructed_lines.append('')
-            else:
-                # Determine section type
-                detected_type = self._detect_line_type(stripped, patterns)
-                
-                if section_type is None:
-                    section_type = detected_type
-                elif section_type != detected_type:
-                    # Section type changed - process current section
-                    if section_type == "flowing":
-                        reconstructed_lines.append(' '.join(current_section))
-                    else:
-                        reconstructed_lines.extend(current_section)
-                    current_section = [stripped]
-                    section_type = detected_type
-                    continue
-                
-                current_section.append(stripped)
+            reconstructed_lines.append(line)
         
-        # Handle remaining section
-        if current_section:
-            if section_type == "flowing":
-                reconstructed_lines.append(' '.join(current_section))
-            else:
-                reconstructed_lines.extend(current_section)
+        # Handle remaining flowing run
+        if flow_start >= 0:
+            reconstructed_lines[flow_start:] = [' '.join(reconstructed_lines[flow_start:])]
         
         return '\n'.join(reconstructed_lines)
     
-    def _is_paragraph_break(self, line: str, patterns: DocumentPattern) -> bool:
-        """Determine if line indicates a paragraph break using learned patterns"""
-        
-        # Use discovered paragraph markers
-        for marker in patterns.paragraph_markers:
-            if marker == 'header_caps' and line.isupper() and len(line) < 50:
-                return True
-            elif marker == 'section_header' and line.endswith(':'):
-                return True
-            elif marker == 'numbered_list' and re.match(r'^\d+\.', line):
-                return True
-            elif marker == 'bullet_list' and re.match(r'^[•\-\*]', line):
-                return True
-        
-        return False
+    def _classify_lines(self, lines: List[str], patterns: DocumentPattern) -> List[int]:
+        """Classify stripped lines as empty, flowing text or structured content"""
+        
+        # Without learned structural markers every non-empty line is flowing text
+        if not patterns.marker_bits & _STRUCTURED_MARKERS:
+            return [_LINE_FLOWING if line else _LINE_EMPTY for line in lines]
+        
+        return [
+            _LINE_EMPTY if not line
+            else _LINE_STRUCTURED if (_RE_LIST_START.match(line) or line.isupper() or len(line) < 40)
+            else _LINE_FLOWING
+            for line in lines
+        ]
+
+
+# Worker pool shared by all orchestrators for per-page reconstruction
+_reconstruction_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_reconstruction_pool() -> ThreadPoolExecutor:
+    """Get (lazily creating) the shared page reconstruction pool"""
+    global _reconstruction_pool
     
-    def _detect_line_type(self, line: str, patterns: DocumentPattern) -> str:
-        """Detect whether line is flowing text or structured content"""
-        
-        # Check against learned patterns
-        if any(marker in patterns.paragraph_markers for marker in ['bullet_list', 'numbered_list', 'header_caps']):
-            if (re.match(r'^[•\-\*\d]', line) or 
-                line.isupper() or 
-                len(line) < 40):
-                return "structured"
-        
-        return "flowing"
+    if _reconstruction_pool is None:
+        _reconstruction_pool = ThreadPoolExecutor(
+            max_workers=min(32, os.cpu_count() or 1),
+            thread_name_prefix="sutra-reconstruct"
+        )
+    
+    return _reconstruction_pool
+
+
+# Patterns discovered for recently seen document fingerprints (shared by all orchestrators)
+_PATTERN_CACHE_SIZE = 10_000
+_PATTERN_CACHE: "OrderedDict[bytes, DocumentPattern]" = OrderedDict()
 
 
 class UniversalAIGuidedExtractionOrchestrator:
@@ -490,7 +712,7 @@ class UniversalAIGuidedExtractionOrchestrator:
     def __init__(self, embeddings: EmbeddingService):
         self.embeddings = embeddings
         self.pattern_detector = UniversalPatternDetector(embeddings)
-        self.text_reconstructor = AdaptiveTextFlowReconstructor()
+        self.text_reconstructor = AdaptiveTextFlowReconstructor(executor=_get_reconstruction_pool())
     
     async def enhance_extraction(self, document: ParsedDocument) -> Tuple[ParsedDocument, Dict[str, Any]]:
         """
@@ -500,13 +722,29 @@ class UniversalAIGuidedExtractionOrchestrator:
         """
         
         # 1. Discover document patterns using AI
-        patterns = await self.pattern_detector.discover_document_patterns(document)
+        #    (near-duplicate documents reuse a previously discovered pattern)
+        fingerprint = self._structural_fingerprint(document)
+        cached = _PATTERN_CACHE.get(fingerprint) if fingerprint else None
+        
+        if cached is None:
+            patterns = await self.pattern_detector.discover_document_patterns(document)
+            if fingerprint:
+                _PATTERN_CACHE[fingerprint] = self._reuse_pattern(patterns)
+                if len(_PATTERN_CACHE) > _PATTERN_CACHE_SIZE:
+                    _PATTERN_CACHE.popitem(last=False)
+        else:
+            _PATTERN_CACHE.move_to_end(fingerprint)
+            patterns = self._reuse_pattern(cached, document)
         
         # 2. Reconstruct text flow using discovered patterns
         enhanced_document = await self.text_reconstructor.reconstruct_text_flow(document, patterns)
         
         # 3. Apply semantic sectioning using embedding boundaries
-        enhanced_document = await self._apply_semantic_sectioning(enhanced_document, patterns)
+        section_pages = self._apply_semantic_sectioning(enhanced_document, patterns)
+        
+        # Regenerate full text once, after all page-level rewrites
+        if patterns.text_flow_type != "empty" or section_pages:
+            enhanced_document.text = self._join_page_texts(enhanced_document, section_pages)
         
         # 4. Generate enhancement metadata
         metadata = {
@@ -529,27 +767,89 @@ class UniversalAIGuidedExtractionOrchestrator:
         
         return enhanced_document, metadata
     
-    async def _apply_semantic_sectioning(
+    def _structural_fingerprint(self, document: ParsedDocument) -> Optional[bytes]:
+        """Cheap structural fingerprint used to skip pattern discovery for near-duplicates"""
+        
+        if not document.pages:
+            return None
+        
+        total_chars = 0
+        numbered_lines = 0
+        bullet_lines = 0
+        for page in document.pages:
+            text = page.text
+            total_chars += len(text)
+            numbered_lines += len(_RE_NUMBERED_LINE.findall(text))
+            bullet_lines += len(_RE_BULLET_LINE.findall(text))
+        first_page = document.pages[0].text[:2048]
+        
+        # First-page content + page count + document length and list-indicator
+        # count buckets (powers of two)
+        key = (
+            f"{len(document.pages)}:{total_chars.bit_length()}:"
+            f"{numbered_lines.bit_length()}:{bullet_lines.bit_length()}:{first_page}"
+        )
+        return hashlib.blake2b(key.encode(), digest_size=16).digest()
+    
+    def _reuse_pattern(
+        self,
+        pattern: DocumentPattern,
+        document: Optional[ParsedDocument] = None
+    ) -> DocumentPattern:
+        """
+        Copy the document-agnostic part of a pattern
+        
+        Flow type, line length, markers and cues carry over between
+        near-duplicate documents; page-specific boundaries and breaks do not
+        and are dropped. Density is recomputed (cheaply) when a document is given.
+        """
+        
+        return DocumentPattern(
+            avg_line_length=pattern.avg_line_length,
+            paragraph_markers=list(pattern.paragraph_markers),
+            section_boundaries=[],
+            text_flow_type=pattern.text_flow_type,
+            density_clusters=(
+                self.pattern_detector._analyze_density_patterns(document) if document else []
+            ),
+            semantic_breaks=[],
+            formatting_cues=copy.deepcopy(pattern.formatting_cues)
+        )
+    
+    def _apply_semantic_sectioning(
         self, 
         document: ParsedDocument, 
         patterns: DocumentPattern
-    ) -> ParsedDocument:
-        """Apply semantic sectioning using discovered boundaries"""
-        
-        if not patterns.section_boundaries:
-            return document
-        
-        # Apply section breaks at discovered boundaries
-        for boundary_page in patterns.section_boundaries:
-            if boundary_page < len(document.pages):
-                page = document.pages[boundary_page]
-                # Add semantic section marker
-                page.text = f"\n\n---\n\n{page.text}"
+    ) -> Set[int]:
+        """
+        Apply semantic sectioning using discovered boundaries
         
-        # Regenerate full text
-        document.text = "\n\n".join(page.text for page in document.pages if page.text)
+        Only records which pages open a new section; the section markers are
+        written while joining the document text instead of rewriting page text.
+        """
         
-        return document
+        return {
+            boundary_page for boundary_page in patterns.section_boundaries
+            if boundary_page < len(document.pages)
+        }
+    
+    def _join_page_texts(self, document: ParsedDocument, section_pages: Set[int]) -> str:
+        """Join page texts (with section markers) into the full document text in a single buffer"""
+        
+        buffer = io.StringIO()
+        separator = ""
+        
+        for page_idx, page in enumerate(document.pages):
+            starts_section = page_idx in section_pages
+            if page.text or starts_section:
+                buffer.write(separator)
+                if starts_section:
+                    # Add semantic section marker
+                    buffer.write("\n\n---\n\n")
+                buffer.write(page.text)
+                separator = "\n\n"
+        
+        return buffer.getvalue()
     
     def _determine_strategy_name(self, patterns: DocumentPattern) -> str:
         """Determine strategy name based on discovered patterns"""
@@ -5,20 +5,66 @@ Provides structured JSON logging with context injection, performance tracking,
 and integration with distributed tracing systems.
 """
 
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
 import time
 from contextvars import ContextVar
 from typing import Any, Dict, Optional
 from pathlib import Path
 import json
-from datetime import datetime
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log record dict (orjson when available, stdlib json otherwise)"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+            ).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits - let stdlib handle it
+    return json.dumps(data, default=str)
 
 # Context variables for request tracking
 request_id_ctx: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 user_id_ctx: ContextVar[Optional[str]] = ContextVar("user_id", default=None)
 
 
+# Per-thread cache of the formatted "YYYY-MM-DDTHH:MM:SS" prefix for the last second seen
+_timestamp_cache = threading.local()
+
+
+def _utc_timestamp(created: float) -> str:
+    """Format an epoch time as ISO-8601 UTC with microseconds ("...T12:00:00.123456Z")"""
+    secs = int(created)
+    micros = round((created - secs) * 1_000_000)
+    if micros == 1_000_000:
+        secs, micros = secs + 1, 0
+    
+    if getattr(_timestamp_cache, "secs", None) != secs:
+        tm = time.gmtime(secs)
+        _timestamp_cache.secs = secs
+        _timestamp_cache.prefix = (
+            f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+            f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+        )
+    
+    return f"{_timestamp_cache.prefix}.{micros:06d}Z"
+
+
 class StructuredFormatter(logging.Formatter):
     """
     JSON structured log formatter
@@ -32,7 +78,7 @@ class StructuredFormatter(logging.Formatter):
         
         # Base log structure
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "timestamp": _utc_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -41,12 +87,13 @@ class StructuredFormatter(logging.Formatter):
             "line": record.lineno,
         }
         
-        # Add request context if available
-        request_id = request_id_ctx.get()
+        # Add request context if available (captured on the record when it was
+        # queued, otherwise one context lookup each)
+        record_dict = record.__dict__
+        request_id = record_dict["request_id"] if "request_id" in record_dict else request_id_ctx.get()
+        user_id = record_dict["user_id"] if "user_id" in record_dict else user_id_ctx.get()
         if request_id:
             log_data["request_id"] = request_id
-        
-        user_id = user_id_ctx.get()
         if user_id:
             log_data["user_id"] = user_id
         
@@ -58,15 +105,13 @@ class StructuredFormatter(logging.Formatter):
                 "traceback": self.formatException(record.exc_info) if record.exc_info else None,
             }
         
-        # Add custom attributes from extra
-        if hasattr(record, "extra"):
-            log_data["extra"] = record.extra
-        
-        # Add performance metrics if available
-        if hasattr(record, "duration_ms"):
-            log_data["duration_ms"] = record.duration_ms
+        # Add custom attributes from extra and performance metrics if available
+        if "extra" in record_dict:
+            log_data["extra"] = record_dict["extra"]
+        if "duration_ms" in record_dict:
+            log_data["duration_ms"] = record_dict["duration_ms"]
         
-        return json.dumps(log_data, default=str)
+        return _json_dumps(log_data)
 
 
 class TextFormatter(logging.Formatter):
@@ -82,29 +127,24 @@ class TextFormatter(logging.Formatter):
         'CRITICAL': '\033[35m',   # Magenta
         'RESET': '\033[0m',       # Reset
     }
+    RESET = COLORS['RESET']
+    TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors"""
-        color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        reset = self.COLORS['RESET']
+        color = self.COLORS.get(record.levelname, self.RESET)
+        reset = self.RESET
         
         # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = time.strftime(self.TIME_FORMAT, time.localtime(record.created))
         
-        # Build message
-        message_parts = [
-            f"{color}[{timestamp}]{reset}",
-            f"{color}[{record.levelname}]{reset}",
-            f"[{record.name}]",
-            record.getMessage()
-        ]
-        
-        # Add request ID if available
-        request_id = request_id_ctx.get()
-        if request_id:
-            message_parts.insert(3, f"[req:{request_id[:8]}]")
-        
-        message = " ".join(message_parts)
+        # Build message (request ID only if available)
+        request_id = getattr(record, "request_id", None) or request_id_ctx.get()
+        request_part = f" [req:{request_id[:8]}]" if request_id else ""
+        message = (
+            f"{color}[{timestamp}]{reset} {color}[{record.levelname}]{reset} "
+            f"[{record.name}]{request_part} {record.getMessage()}"
+        )
         
         # Add exception info
         if record.exc_info:
@@ -113,6 +153,44 @@ class TextFormatter(logging.Formatter):
         return message
 
 
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a same-process listener
+    
+    The stock ``prepare`` formats the record and strips ``exc_info`` so it
+    can be pickled; here the record never leaves the process, so only the
+    message is merged and the exception stays available to
+    StructuredFormatter on the listener thread. The request context is
+    copied onto the record, since the context variables are unset on the
+    listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.request_id = request_id_ctx.get()
+        record.user_id = user_id_ctx.get()
+        return record
+
+
+# Background listener writing queued records to the log files
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the file logging listener, if running"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 class PerformanceLogger:
     """
     Context manager for performance logging
@@ -123,6 +201,8 @@ class PerformanceLogger:
             pass
     """
     
+    __slots__ = ("logger", "operation", "level", "extra", "start_time")
+    
     def __init__(
         self, 
         logger: logging.Logger, 
@@ -141,6 +221,10 @@ class PerformanceLogger:
         return self
     
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        # Skip all formatting work when the record would be filtered out
+        if exc_type is None and not self.logger.isEnabledFor(self.level):
+            return
+        
         duration_ms = (time.perf_counter() - self.start_time) * 1000
         
         log_extra = {
@@ -152,12 +236,16 @@ class PerformanceLogger:
         if exc_type is None:
             self.logger.log(
                 self.level,
-                f"{self.operation} completed in {duration_ms:.2f}ms",
+                "%s completed in %.2fms",
+                self.operation,
+                duration_ms,
                 extra={"extra": log_extra}
             )
         else:
             self.logger.error(
-                f"{self.operation} failed after {duration_ms:.2f}ms",
+                "%s failed after %.2fms",
+                self.operation,
+                duration_ms,
                 exc_info=(exc_type, exc_val, exc_tb),
                 extra={"extra": log_extra}
             )
@@ -183,8 +271,9 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
     
-    # Remove existing handlers
+    # Remove existing handlers (and drain a previous file listener)
     root_logger.handlers.clear()
+    _stop_queue_listener()
     
     # Choose formatter
     if log_format == "json":
@@ -209,7 +298,6 @@ def setup_logging(
         )
         file_handler.setLevel(getattr(logging, log_level.upper()))
         file_handler.setFormatter(StructuredFormatter())  # Always JSON for files
-        root_logger.addHandler(file_handler)
         
         # Error log file
         error_handler = logging.FileHandler(
@@ -218,7 +306,15 @@ def setup_logging(
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(StructuredFormatter())
-        root_logger.addHandler(error_handler)
+        
+        # File writes happen on a listener thread, off the caller's path
+        global _queue_listener
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        root_logger.addHandler(_InProcessQueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, error_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
     
     # Suppress noisy loggers
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -5,18 +5,52 @@ Tracks all Nomic API calls to help stay within free tier limits and monitor cost
 """
 
 import asyncio
+import atexit
+import os
+import sys
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
-import json
 from pathlib import Path
 from collections import defaultdict
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _json_default(obj: Any) -> Any:
+    """Stdlib json fallback for datetimes (orjson handles them natively)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    import json
+    if indent:
+        return json.dumps(data, indent=2, default=_json_default).encode()
+    return json.dumps(data, separators=(',', ':'), default=_json_default).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+
+@dataclass(slots=True)
 class UsageStats:
     """Statistics for Nomic API usage"""
     
@@ -36,10 +70,10 @@ class UsageStats:
     last_call: Optional[datetime] = None
     
     # Breakdown by day
-    daily_usage: Dict[str, int] = field(default_factory=dict)
+    daily_usage: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
     
     # Breakdown by document type
-    by_document_type: Dict[str, int] = field(default_factory=dict)
+    by_document_type: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -49,8 +83,8 @@ class UsageStats:
             'total_embeddings': self.total_embeddings,
             'documents_processed': self.documents_processed,
             'estimated_cost': self.estimated_cost,
-            'first_call': self.first_call.isoformat() if self.first_call else None,
-            'last_call': self.last_call.isoformat() if self.last_call else None,
+            'first_call': self.first_call,
+            'last_call': self.last_call,
             'daily_usage': self.daily_usage,
             'by_document_type': self.by_document_type,
         }
@@ -64,8 +98,8 @@ class UsageStats:
             total_embeddings=data.get('total_embeddings', 0),
             documents_processed=data.get('documents_processed', 0),
             estimated_cost=data.get('estimated_cost', 0.0),
-            daily_usage=data.get('daily_usage', {}),
-            by_document_type=data.get('by_document_type', {}),
+            daily_usage=defaultdict(int, data.get('daily_usage', {})),
+            by_document_type=defaultdict(int, data.get('by_document_type', {})),
         )
         
         if data.get('first_call'):
@@ -99,6 +133,21 @@ class NomicUsageTracker:
     WARNING_THRESHOLD = 0.80  # Warn at 80% of limit
     CRITICAL_THRESHOLD = 0.95  # Critical at 95% of limit
     
+    # Embedding kinds: (stats counter attribute, cost per 1K, usage-log name)
+    KIND_TEXT = 0
+    KIND_MULTIMODAL = 1
+    _KIND_TABLE = (
+        ('text_embeddings', COST_PER_1K_TEXT_EMBEDDINGS, 'text'),
+        ('multimodal_embeddings', COST_PER_1K_MULTIMODAL, 'multimodal'),
+    )
+    _LOG_KINDS = {log_kind: i for i, (_, _, log_kind) in enumerate(_KIND_TABLE)}
+    
+    # Persistence batching: flush the usage log after this many updates or
+    # this many seconds; fold it into the aggregate JSON every COMPACT_INTERVAL_S
+    FLUSH_EVERY = 50
+    FLUSH_INTERVAL_S = 5.0
+    COMPACT_INTERVAL_S = 300.0
+    
     def __init__(self, storage_path: Optional[Path] = None):
         """
         Initialize usage tracker
@@ -109,35 +158,232 @@ class NomicUsageTracker:
         self.storage_path = storage_path or Path("./usage_logs/nomic_usage.json")
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Load existing stats
+        # Append-only log of per-call deltas since the last compaction
+        self._log_path = self.storage_path.with_suffix('.log')
+        self._seq = 0  # Sequence number of the last logged delta
+        
+        # Load existing stats (aggregate + replayed log), then fold the log in
         self.stats = self._load_stats()
+        self._log_f = open(self._log_path, 'ab')
+        self._write_items([self._snapshot()])
+        
+        # Serialized deltas not yet handed to the writer, and the writer task
+        # (bound to the event loop it runs on) that performs all file I/O
+        self._pending_deltas: List[bytes] = []
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._writer_loop = None
+        
+        # Running total for the current month (kept in step with daily_usage)
+        self._current_month_key = datetime.now().strftime('%Y-%m')
+        self._monthly_total = self._scan_monthly_usage()
         
         # In-memory cache for quick access
         self._session_stats = UsageStats()
         
-        # Lock for thread-safe updates
+        # Lock for counter updates (disk writes go through the writer task)
         self._lock = asyncio.Lock()
+        self._background_tasks: set = set()
+        
+        # Wall-clock time and date string, recomputed once per second
+        self._cached_epoch = -1
+        self._cached_now: Optional[datetime] = None
+        self._cached_today = ""
+        
+        # Memoized get_summary() result keyed on (total_embeddings, minute)
+        self._summary_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+        
+        # Unsaved updates since the last flush
+        self._dirty_count = 0
+        self._last_flush_ts = time.monotonic()
     
     def _load_stats(self) -> UsageStats:
-        """Load usage stats from disk"""
+        """Load usage stats from disk (aggregate JSON plus newer log entries)"""
+        stats = UsageStats()
+        
         if self.storage_path.exists():
             try:
-                with open(self.storage_path, 'r') as f:
-                    data = json.load(f)
-                return UsageStats.from_dict(data)
+                with open(self.storage_path, 'rb') as f:
+                    data = _loads(f.read())
+                stats = UsageStats.from_dict(data)
+                self._seq = data.get('log_seq', 0)
             except Exception as e:
                 logger.warning(f"Failed to load usage stats: {e}")
         
-        return UsageStats()
+        if self._log_path.exists():
+            try:
+                with open(self._log_path, 'rb') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        delta = _loads(line)
+                        # Entries up to the compacted sequence are already in the aggregate
+                        if delta['seq'] > self._seq:
+                            self._apply_delta(stats, delta)
+                            self._seq = delta['seq']
+            except Exception as e:
+                logger.warning(f"Failed to replay usage log: {e}")
+        
+        return stats
+    
+    def _apply_delta(self, stats: UsageStats, delta: Dict[str, Any]):
+        """Fold one logged usage delta into aggregate stats"""
+        count = delta['count']
+        ts = datetime.fromisoformat(delta['ts'])
+        
+        counter_attr, cost_per_1k, _ = self._KIND_TABLE[self._LOG_KINDS[delta['kind']]]
+        setattr(stats, counter_attr, getattr(stats, counter_attr) + count)
+        stats.estimated_cost += (count / 1000) * cost_per_1k
+        stats.total_embeddings += count
+        stats.documents_processed += 1
+        
+        if stats.first_call is None or ts < stats.first_call:
+            stats.first_call = ts
+        if stats.last_call is None or ts > stats.last_call:
+            stats.last_call = ts
+        
+        day = ts.date().isoformat()
+        stats.daily_usage[day] += count
+        
+        document_type = delta.get('type')
+        if document_type:
+            stats.by_document_type[document_type] += 1
+    
+    def _append_delta(self, kind: str, count: int, document_type: Optional[str], now: datetime):
+        """Serialize a one-line usage delta into the pending batch"""
+        self._seq += 1
+        delta = {
+            'seq': self._seq,
+            'ts': now.isoformat(),
+            'kind': kind,
+            'count': count,
+            'type': document_type,
+        }
+        self._pending_deltas.append(_dumps(delta) + b'\n')
     
-    def _save_stats(self):
-        """Save usage stats to disk"""
+    def _snapshot(self) -> Tuple[str, bytes]:
+        """Serialize the aggregate stats as a compaction item for the writer"""
+        data = self.stats.to_dict()
+        data['log_seq'] = self._seq
+        self._last_compact_ts = time.monotonic()
+        return ('compact', _dumps(data, indent=True))
+    
+    def _take_batch(self, compact: bool = False) -> List[Any]:
+        """Hand off pending deltas (plus a compaction snapshot when due) as writer items"""
+        items: List[Any] = []
+        if self._pending_deltas:
+            items.append(b''.join(self._pending_deltas))
+            self._pending_deltas.clear()
+        if compact or time.monotonic() - self._last_compact_ts > self.COMPACT_INTERVAL_S:
+            items.append(self._snapshot())
+        
+        self._dirty_count = 0
+        self._last_flush_ts = time.monotonic()
+        return items
+    
+    def _write_items(self, items: List[Any]):
+        """
+        Perform queued file I/O (runs on a worker thread)
+        
+        Byte chunks are appended to the usage log; a compaction item writes
+        the aggregate JSON atomically and truncates the log. Items are
+        processed in order, so deltas queued after a snapshot survive it.
+        """
         try:
-            with open(self.storage_path, 'w') as f:
-                json.dump(self.stats.to_dict(), f, indent=2)
+            for item in items:
+                if isinstance(item, bytes):
+                    self._log_f.write(item)
+                    continue
+                
+                _, data = item
+                self._log_f.flush()
+                tmp_path = self.storage_path.with_suffix('.json.tmp')
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.storage_path)
+                
+                # Everything logged so far is now in the aggregate
+                self._log_f.truncate(0)
+            
+            self._log_f.flush()
         except Exception as e:
             logger.error(f"Failed to save usage stats: {e}")
     
+    def _get_write_queue(self) -> asyncio.Queue:
+        """Return the writer queue for the running loop, starting the writer if needed"""
+        loop = asyncio.get_running_loop()
+        
+        if self._writer_loop is not loop:
+            # Items left behind by a writer on a previous (finished) loop
+            self._write_items(self._drain_write_queue())
+            self._write_queue = asyncio.Queue()
+            self._writer_task = loop.create_task(self._writer())
+            self._writer_loop = loop
+        
+        return self._write_queue
+    
+    def _drain_write_queue(self) -> List[Any]:
+        """Remove and return everything still queued for the writer"""
+        items: List[Any] = []
+        if self._write_queue is not None:
+            while not self._write_queue.empty():
+                items.append(self._write_queue.get_nowait())
+        return items
+    
+    async def _writer(self):
+        """Background task: write queued batches off the event loop thread"""
+        queue = self._write_queue
+        while True:
+            items = [await queue.get()]
+            while not queue.empty():
+                items.append(queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._write_items, items)
+            finally:
+                for _ in items:
+                    queue.task_done()
+    
+    def _schedule_flush(self, compact: bool = False):
+        """Queue pending deltas for the writer task (never blocks the loop)"""
+        queue = self._get_write_queue()
+        for item in self._take_batch(compact):
+            queue.put_nowait(item)
+    
+    def _mark_dirty(self) -> bool:
+        """Record an update; returns True once enough updates or time have accumulated to flush"""
+        self._dirty_count += 1
+        return (self._dirty_count >= self.FLUSH_EVERY or
+                time.monotonic() - self._last_flush_ts > self.FLUSH_INTERVAL_S)
+    
+    async def flush(self):
+        """Persist any unsaved usage stats and wait for the writes to complete"""
+        self._schedule_flush()
+        await self._write_queue.join()
+    
+    def _spawn(self, coro):
+        """Run a coroutine in the background, keeping a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    def _flush_on_exit(self):
+        """Synchronous compaction for interpreter shutdown (no event loop available)"""
+        items = self._drain_write_queue()
+        items.extend(self._take_batch(compact=True))
+        self._write_items(items)
+        self._log_f.close()
+    
+    def _now_and_today(self):
+        """Current datetime and ISO date, cached within the same wall-clock second"""
+        t = time.time()
+        sec = int(t)
+        if sec != self._cached_epoch:
+            self._cached_epoch = sec
+            self._cached_now = datetime.fromtimestamp(t)
+            self._cached_today = self._cached_now.date().isoformat()
+        return self._cached_now, self._cached_today
+    
     async def track_text_embedding(
         self,
         count: int = 1,
@@ -150,41 +396,7 @@ class NomicUsageTracker:
             count: Number of embeddings generated
             document_type: Type of document being processed
         """
-        async with self._lock:
-            now = datetime.now()
-            today = now.date().isoformat()
-            
-            # Update counters
-            self.stats.text_embeddings += count
-            self.stats.total_embeddings += count
-            self.stats.documents_processed += 1
-            
-            # Update cost
-            cost = (count / 1000) * self.COST_PER_1K_TEXT_EMBEDDINGS
-            self.stats.estimated_cost += cost
-            
-            # Update timestamps
-            if self.stats.first_call is None:
-                self.stats.first_call = now
-            self.stats.last_call = now
-            
-            # Update daily usage
-            self.stats.daily_usage[today] = self.stats.daily_usage.get(today, 0) + count
-            
-            # Update by document type
-            if document_type:
-                self.stats.by_document_type[document_type] = \
-                    self.stats.by_document_type.get(document_type, 0) + 1
-            
-            # Session stats
-            self._session_stats.text_embeddings += count
-            self._session_stats.total_embeddings += count
-            
-            # Save periodically
-            self._save_stats()
-            
-            # Check limits
-            await self._check_limits()
+        await self._track(self.KIND_TEXT, count, document_type)
     
     async def track_multimodal_embedding(
         self,
@@ -198,45 +410,66 @@ class NomicUsageTracker:
             count: Number of embeddings generated
             document_type: Type of document being processed
         """
+        await self._track(self.KIND_MULTIMODAL, count, document_type)
+    
+    async def _track(self, kind: int, count: int, document_type: Optional[str]):
+        """Record `count` embeddings of the given kind (index into _KIND_TABLE)"""
+        counter_attr, cost_per_1k, log_kind = self._KIND_TABLE[kind]
+        now, today = self._now_and_today()
+        cost = (count / 1000) * cost_per_1k
+        
+        # Critical section: in-memory counter/dict updates only
         async with self._lock:
-            now = datetime.now()
-            today = now.date().isoformat()
+            stats = self.stats
             
             # Update counters
-            self.stats.multimodal_embeddings += count
-            self.stats.total_embeddings += count
-            self.stats.documents_processed += 1
+            setattr(stats, counter_attr, getattr(stats, counter_attr) + count)
+            stats.total_embeddings += count
+            stats.documents_processed += 1
             
             # Update cost
-            cost = (count / 1000) * self.COST_PER_1K_MULTIMODAL
-            self.stats.estimated_cost += cost
+            stats.estimated_cost += cost
             
             # Update timestamps
-            if self.stats.first_call is None:
-                self.stats.first_call = now
-            self.stats.last_call = now
+            if stats.first_call is None:
+                stats.first_call = now
+            stats.last_call = now
             
             # Update daily usage
-            self.stats.daily_usage[today] = self.stats.daily_usage.get(today, 0) + count
+            stats.daily_usage[today] += count
+            
+            # Update running monthly total
+            month_key = today[:7]
+            if month_key != self._current_month_key:
+                self._current_month_key = month_key
+                self._monthly_total = self._scan_monthly_usage()
+            else:
+                self._monthly_total += count
             
             # Update by document type
             if document_type:
-                self.stats.by_document_type[document_type] = \
-                    self.stats.by_document_type.get(document_type, 0) + 1
+                stats.by_document_type[document_type] += 1
             
             # Session stats
-            self._session_stats.multimodal_embeddings += count
-            self._session_stats.total_embeddings += count
-            
-            # Save periodically
-            self._save_stats()
+            session = self._session_stats
+            setattr(session, counter_attr, getattr(session, counter_attr) + count)
+            session.total_embeddings += count
             
-            # Check limits
-            await self._check_limits()
+            # Log the delta (buffered)
+            self._append_delta(log_kind, count, document_type, now)
+            flush_due = self._mark_dirty()
+        
+        # Flush periodically (written by the background writer task)
+        if flush_due:
+            self._schedule_flush()
+        
+        # Check limits in the background
+        self._spawn(self._check_limits())
     
     async def _check_limits(self):
         """Check if approaching free tier limits"""
-        monthly_usage = self.get_monthly_usage()
+        async with self._lock:
+            monthly_usage = self.get_monthly_usage()
         usage_percentage = monthly_usage / self.FREE_TIER_MONTHLY_LIMIT
         
         if usage_percentage >= self.CRITICAL_THRESHOLD:
@@ -252,29 +485,46 @@ class NomicUsageTracker:
     
     def get_monthly_usage(self) -> int:
         """Get total embeddings used this month"""
-        now = datetime.now()
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        month_key = datetime.now().strftime('%Y-%m')
+        if month_key != self._current_month_key:
+            # Month rolled over since the last update
+            self._current_month_key = month_key
+            self._monthly_total = self._scan_monthly_usage()
         
-        monthly_total = 0
-        for date_str, count in self.stats.daily_usage.items():
-            date = datetime.fromisoformat(date_str)
-            if date >= month_start:
-                monthly_total += count
+        return self._monthly_total
+    
+    def _scan_monthly_usage(self) -> int:
+        """Sum daily usage from the start of the current month"""
+        # ISO dates (YYYY-MM-DD) order lexicographically, so no parsing is needed
+        month_start = datetime.now().strftime('%Y-%m-01')
         
-        return monthly_total
+        return sum(
+            count for date_str, count in self.stats.daily_usage.items()
+            if date_str >= month_start
+        )
     
     def get_daily_usage(self, days: int = 7) -> Dict[str, int]:
         """Get usage for last N days"""
-        cutoff = (datetime.now() - timedelta(days=days)).date()
+        cutoff = (datetime.now() - timedelta(days=days)).date().isoformat()
         
         return {
             date: count
             for date, count in self.stats.daily_usage.items()
-            if datetime.fromisoformat(date).date() >= cutoff
+            if date >= cutoff
         }
     
     def get_summary(self) -> Dict[str, Any]:
-        """Get comprehensive usage summary"""
+        """Get comprehensive usage summary (memoized until usage changes or the minute rolls over)"""
+        key = (self.stats.total_embeddings, int(time.time()) // 60)
+        if self._summary_cache is not None and self._summary_cache[0] == key:
+            return self._summary_cache[1]
+        
+        summary = self._build_summary()
+        self._summary_cache = (key, summary)
+        return summary
+    
+    def _build_summary(self) -> Dict[str, Any]:
+        """Compute the usage summary"""
         monthly_usage = self.get_monthly_usage()
         usage_percentage = monthly_usage / self.FREE_TIER_MONTHLY_LIMIT
         remaining = self.FREE_TIER_MONTHLY_LIMIT - monthly_usage
@@ -329,44 +579,53 @@ class NomicUsageTracker:
         """Print formatted usage summary"""
         summary = self.get_summary()
         
-        print("\n" + "="*60)
-        print("📊 NOMIC API USAGE TRACKER")
-        print("="*60)
-        
-        print(f"\n📈 OVERALL STATS:")
-        print(f"  Total Embeddings: {summary['total_embeddings']:,}")
-        print(f"  ├─ Text: {summary['text_embeddings']:,}")
-        print(f"  └─ Multimodal: {summary['multimodal_embeddings']:,}")
-        print(f"  Documents Processed: {summary['documents_processed']:,}")
-        print(f"  Estimated Cost: {summary['estimated_cost']}")
-        
-        print(f"\n📅 THIS MONTH:")
-        print(f"  Usage: {summary['monthly_usage']:,} / {summary['monthly_limit']:,} ({summary['usage_percentage']})")
-        print(f"  Remaining: {summary['remaining']:,}")
-        print(f"  Status: {summary['status']}")
-        
-        print(f"\n📊 PROJECTIONS:")
-        print(f"  Avg Daily: {summary['avg_daily_usage']:,} embeddings/day")
-        print(f"  Days Until Limit: {summary['days_until_limit']}")
-        
-        print(f"\n💻 THIS SESSION:")
-        print(f"  Embeddings: {summary['session_embeddings']:,}")
-        print(f"  Documents: {summary['session_documents']:,}")
+        lines = [
+            "\n" + "="*60,
+            "📊 NOMIC API USAGE TRACKER",
+            "="*60,
+            
+            f"\n📈 OVERALL STATS:",
+            f"  Total Embeddings: {summary['total_embeddings']:,}",
+            f"  ├─ Text: {summary['text_embeddings']:,}",
+            f"  └─ Multimodal: {summary['multimodal_embeddings']:,}",
+            f"  Documents Processed: {summary['documents_processed']:,}",
+            f"  Estimated Cost: {summary['estimated_cost']}",
+            
+            f"\n📅 THIS MONTH:",
+            f"  Usage: {summary['monthly_usage']:,} / {summary['monthly_limit']:,} ({summary['usage_percentage']})",
+            f"  Remaining: {summary['remaining']:,}",
+            f"  Status: {summary['status']}",
+            
+            f"\n📊 PROJECTIONS:",
+            f"  Avg Daily: {summary['avg_daily_usage']:,} embeddings/day",
+            f"  Days Until Limit: {summary['days_until_limit']}",
+            
+            f"\n💻 THIS SESSION:",
+            f"  Embeddings: {summary['session_embeddings']:,}",
+            f"  Documents: {summary['session_documents']:,}",
+        ]
         
         if summary['by_document_type']:
-            print(f"\n📄 BY DOCUMENT TYPE:")
-            for doc_type, count in sorted(
-                summary['by_document_type'].items(), 
-                key=lambda x: x[1], 
-                reverse=True
-            ):
-                print(f"  {doc_type}: {count:,}")
+            lines.append(f"\n📄 BY DOCUMENT TYPE:")
+            lines.extend(
+                f"  {doc_type}: {count:,}"
+                for doc_type, count in sorted(
+                    summary['by_document_type'].items(), 
+                    key=lambda x: x[1], 
+                    reverse=True
+                )
+            )
+        
+        lines.append("\n" + "="*60 + "\n")
         
-        print("\n" + "="*60 + "\n")
+        # One write instead of a print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     def reset_session_stats(self):
         """Reset session statistics"""
         self._session_stats = UsageStats()
+        self._summary_cache = None
 
 
 # Global instance
@@ -378,6 +637,7 @@ def get_tracker() -> NomicUsageTracker:
     global _tracker
     if _tracker is None:
         _tracker = NomicUsageTracker()
+        atexit.register(_tracker._flush_on_exit)
     return _tracker
 
 
@@ -30,12 +30,13 @@ Usage:
 from typing import Optional
 from pathlib import Path
 from .base import BaseParser, ParserResult
-from .factory import get_parser, get_supported_formats, is_supported
+from .factory import get_parser, parse_many, get_supported_formats, is_supported
 
 __all__ = [
     "BaseParser",
     "ParserResult",
     "get_parser",
+    "parse_many",
     "get_supported_formats",
     "is_supported"
 ]
@@ -9,8 +9,7 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Optional, Dict, Any, AsyncIterator
 from dataclasses import dataclass, field
-import hashlib
-import mimetypes
+from functools import cached_property
 import logging
 from datetime import datetime
 
@@ -24,9 +23,57 @@ from ..models.document import (
 )
 from ..models.enums import DocumentType
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Read size for streaming file hashes
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Document type lookup by file extension, then by MIME type
+_EXT_MAP: Dict[str, DocumentType] = {
+    '.pdf': DocumentType.PDF,
+    '.doc': DocumentType.WORD,
+    '.docx': DocumentType.WORD,
+    '.ppt': DocumentType.POWERPOINT,
+    '.pptx': DocumentType.POWERPOINT,
+    '.xls': DocumentType.SPREADSHEET,
+    '.xlsx': DocumentType.SPREADSHEET,
+    '.jpg': DocumentType.IMAGE,
+    '.jpeg': DocumentType.IMAGE,
+    '.png': DocumentType.IMAGE,
+    '.gif': DocumentType.IMAGE,
+    '.bmp': DocumentType.IMAGE,
+    '.tiff': DocumentType.IMAGE,
+    '.txt': DocumentType.TEXT,
+    '.md': DocumentType.TEXT,
+    '.rst': DocumentType.TEXT,
+    '.html': DocumentType.HTML,
+    '.htm': DocumentType.HTML,
+    '.csv': DocumentType.CSV,
+}
+
+_MIME_MAP: Dict[str, DocumentType] = {
+    'application/pdf': DocumentType.PDF,
+    'application/msword': DocumentType.WORD,
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': DocumentType.WORD,
+    'application/vnd.ms-powerpoint': DocumentType.POWERPOINT,
+    'application/vnd.openxmlformats-officedocument.presentationml.presentation': DocumentType.POWERPOINT,
+    'application/vnd.ms-excel': DocumentType.SPREADSHEET,
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': DocumentType.SPREADSHEET,
+    'text/plain': DocumentType.TEXT,
+    'text/html': DocumentType.HTML,
+    'text/csv': DocumentType.CSV,
+}
+
+# Image formats accepted by _create_image_info_safe
+_VALID_IMAGE_FORMATS = frozenset({'jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'webp', 'svg', 'ico'})
+
 
 @dataclass
 class ParserResult:
@@ -73,16 +120,17 @@ class BaseParser(ABC):
         self.file_path = Path(file_path)
         self.options = options or {}
         
-        # Validate file exists
-        if not self.file_path.exists():
-            raise FileNotFoundError(f"File not found: {self.file_path}")
+        # Validate file exists (one stat, reused for metadata)
+        try:
+            self._stat = self.file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {self.file_path}") from None
         
         # Detect document type
         self.document_type = self._detect_document_type()
         
-        # Extract basic metadata
-        self.file_size = self.file_path.stat().st_size
-        self.file_hash = self._compute_file_hash()
+        # Extract basic metadata (file_hash is computed on first access)
+        self.file_size = self._stat.st_size
     
     def _detect_document_type(self) -> DocumentType:
         """
@@ -91,59 +139,56 @@ class BaseParser(ABC):
         Returns:
             DocumentType enum value
         """
-        # Get MIME type
-        mime_type, _ = mimetypes.guess_type(str(self.file_path))
-        
         # Check by extension
-        ext = self.file_path.suffix.lower()
+        document_type = _EXT_MAP.get(self.file_path.suffix.lower())
+        if document_type is not None:
+            return document_type
         
-        if ext == '.pdf' or mime_type == 'application/pdf':
-            return DocumentType.PDF
-        elif ext in ['.doc', '.docx'] or mime_type in [
-            'application/msword',
-            'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-        ]:
-            return DocumentType.WORD
-        elif ext in ['.ppt', '.pptx'] or mime_type in [
-            'application/vnd.ms-powerpoint',
-            'application/vnd.openxmlformats-officedocument.presentationml.presentation'
-        ]:
-            return DocumentType.POWERPOINT
-        elif ext in ['.xls', '.xlsx'] or mime_type in [
-            'application/vnd.ms-excel',
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        ]:
-            return DocumentType.SPREADSHEET
-        elif ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff'] or \
-             (mime_type and mime_type.startswith('image/')):
+        # Fall back to MIME type
+        mime_type = self._mime_type
+        document_type = _MIME_MAP.get(mime_type)
+        if document_type is not None:
+            return document_type
+        if mime_type and mime_type.startswith('image/'):
             return DocumentType.IMAGE
-        elif ext in ['.txt', '.md', '.rst'] or mime_type == 'text/plain':
-            return DocumentType.TEXT
-        elif ext in ['.html', '.htm'] or mime_type == 'text/html':
-            return DocumentType.HTML
-        elif ext == '.csv' or mime_type == 'text/csv':
-            return DocumentType.CSV
-        else:
-            return DocumentType.OTHER
+        return DocumentType.OTHER
+    
+    @cached_property
+    def _mime_type(self) -> Optional[str]:
+        """MIME type guessed from the file name (looked up once)"""
+        import mimetypes
+        return mimetypes.guess_type(str(self.file_path))[0]
+    
+    @cached_property
+    def file_hash(self) -> str:
+        """Hash of the file contents, computed lazily on first access"""
+        return self._compute_file_hash()
     
-    def _compute_file_hash(self, algorithm: str = 'sha256') -> str:
+    def _compute_file_hash(self, algorithm: Optional[str] = None) -> str:
         """
         Compute hash of file for caching and deduplication
         
         Args:
-            algorithm: Hash algorithm (default: sha256)
+            algorithm: Hash algorithm (default: xxh3_128, or sha256 when the
+                'secure_hash' option is set or xxhash is not installed)
         
         Returns:
             Hex string of file hash
         """
-        hash_obj = hashlib.new(algorithm)
+        if algorithm is None:
+            secure = self.options.get('secure_hash') or not XXHASH_AVAILABLE
+            algorithm = 'sha256' if secure else 'xxh3_128'
         
-        # Read file in chunks for memory efficiency
         with open(self.file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                hash_obj.update(chunk)
-        
-        return hash_obj.hexdigest()
+            if algorithm == 'xxh3_128':
+                hash_obj = xxhash.xxh3_128()
+                # Read file in chunks for memory efficiency
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                    hash_obj.update(chunk)
+                return hash_obj.hexdigest()
+            
+            import hashlib
+            return hashlib.file_digest(f, algorithm).hexdigest()
     
     def _create_metadata(
         self,
@@ -166,14 +211,13 @@ class BaseParser(ABC):
         Returns:
             DocumentMetadata instance
         """
-        # Use file stats if dates not provided
-        stat = self.file_path.stat()
-        
-        # Convert dates to ISO format strings
-        if created_date is None:
-            created_date = datetime.fromtimestamp(stat.st_ctime)
-        if modified_date is None:
-            modified_date = datetime.fromtimestamp(stat.st_mtime)
+        # Fall back to file stats only for dates the document didn't supply
+        if created_date is None or modified_date is None:
+            stat = self._stat
+            if created_date is None:
+                created_date = datetime.fromtimestamp(stat.st_ctime)
+            if modified_date is None:
+                modified_date = datetime.fromtimestamp(stat.st_mtime)
         
         # Format dates as strings
         created_str = created_date.isoformat() if created_date else None
@@ -296,19 +340,29 @@ class BaseParser(ABC):
                 logger.debug(f"Skipping empty table {table_id}")
                 return None
             
+            # Single pass: widest row, and whether any cell has content
+            max_cols = 0
+            has_content = False
+            for row in rows:
+                if len(row) > max_cols:
+                    max_cols = len(row)
+                # Stops at the first non-blank cell; isspace() doesn't allocate like strip()
+                if not has_content and any(cell and not cell.isspace() for cell in row):
+                    has_content = True
+            
             # Skip tables with all empty cells
-            if all(not any(cell.strip() for cell in row) for row in rows):
+            if not has_content:
                 logger.debug(f"Skipping table {table_id} with all empty cells")
                 return None
             
-            # Normalize row lengths (pad with empty strings)
-            max_cols = max(len(row) for row in rows) if rows else 0
             if max_cols == 0:
                 return None
             
-            for row in rows:
-                while len(row) < max_cols:
-                    row.append('')
+            # Normalize row lengths (pad with empty strings)
+            rows = [
+                row if len(row) == max_cols else row + [''] * (max_cols - len(row))
+                for row in rows
+            ]
             
             # Limit table size
             if len(rows) > max_rows:
@@ -368,11 +422,12 @@ class BaseParser(ABC):
                 logger.debug(f"Image {image_id} too large ({len(data)} bytes), not storing data")
                 data = None
             
-            # Validate format
-            valid_formats = ['jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'webp', 'svg', 'ico']
-            if format.lower() not in valid_formats:
+            # Validate format (stored lowercased)
+            format_lower = format.lower()
+            if format_lower not in _VALID_IMAGE_FORMATS:
                 logger.debug(f"Unknown image format: {format}, using 'unknown'")
-                format = 'unknown'
+                format_lower = 'unknown'
+            format = format_lower
             
             # Create ImageInfo
             return ImageInfo(
@@ -22,9 +22,14 @@ Usage:
         process(element)
 """
 
+import io
+import posixpath
+import struct
 import time
+import threading
+import zipfile
 from pathlib import Path
-from typing import List, Optional, Dict, Any, AsyncIterator
+from typing import BinaryIO, List, Optional, Dict, Any, AsyncIterator, Tuple
 from datetime import datetime
 import asyncio
 
@@ -41,14 +46,179 @@ from .base import BaseParser, ParserResult, ParserError, CorruptedFileError
 
 try:
     from docx import Document
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
     from docx.oxml.text.paragraph import CT_P
     from docx.oxml.table import CT_Tbl
     from docx.table import _Cell, Table
     from docx.text.paragraph import Paragraph
+    from lxml import etree
     PYTHON_DOCX_AVAILABLE = True
 except ImportError:
     PYTHON_DOCX_AVAILABLE = False
 
+# WordprocessingML element tags
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_T = W_NS + "t"
+W_TAB = W_NS + "tab"
+W_BR = W_NS + "br"
+W_CR = W_NS + "cr"
+W_NO_BREAK_HYPHEN = W_NS + "noBreakHyphen"
+W_PTAB = W_NS + "ptab"
+W_TYPE = W_NS + "type"
+W_P = W_NS + "p"
+W_R = W_NS + "r"
+W_HYPERLINK = W_NS + "hyperlink"
+W_TBL = W_NS + "tbl"
+W_TR = W_NS + "tr"
+W_TC = W_NS + "tc"
+W_BODY = W_NS + "body"
+
+# Body elements converted per batch in parse_stream, and how many converted
+# batches the worker thread may run ahead of the consumer
+STREAM_BATCH_SIZE = 64
+STREAM_QUEUE_SIZE = 2
+
+# Parts inside the DOCX package
+DOCUMENT_PART = "word/document.xml"
+CORE_PROPS_PART = "docProps/core.xml"
+DOCUMENT_RELS_PART = "word/_rels/document.xml.rels"
+
+# Relationship element in a .rels part
+_PR_RELATIONSHIP = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+
+# Core property name -> element tag in docProps/core.xml
+_DC = "{http://purl.org/dc/elements/1.1/}"
+_DCTERMS = "{http://purl.org/dc/terms/}"
+_CP = "{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}"
+_CORE_PROPERTIES = {
+    "title": _DC + "title",
+    "author": _DC + "creator",
+    "created": _DCTERMS + "created",
+    "modified": _DCTERMS + "modified",
+    "subject": _DC + "subject",
+    "keywords": _CP + "keywords",
+}
+
+# Image format by media file extension
+_MEDIA_FORMATS = {
+    ".jpg": "jpg",
+    ".jpeg": "jpg",
+    ".png": "png",
+    ".gif": "gif",
+    ".bmp": "bmp",
+    ".tif": "tiff",
+    ".tiff": "tiff",
+}
+
+# Image format by part content type
+_IMAGE_FORMATS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/gif": "gif",
+    "image/bmp": "bmp",
+    "image/tiff": "tiff",
+}
+
+# Largest image payload kept in memory, and how far into a JPEG to look for
+# the frame header when sniffing dimensions
+MAX_IMAGE_SIZE = 10 * 1024 * 1024
+IMAGE_SNIFF_LIMIT = 128 * 1024
+
+# JPEG start-of-frame markers (SOF0-SOF15 minus DHT, JPG and DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _collect_run_text(element: Any, parts: List[str]) -> None:
+    """
+    Append the text of the runs directly under element (or a hyperlink)
+    
+    Follows python-docx Paragraph.text: only w:r and w:hyperlink children
+    count, so tracked insertions (w:ins) and smart tags are left out.
+    """
+    for child in element:
+        tag = child.tag
+        if tag == W_R:
+            # Only the run's own text nodes; w:drawing, w:pict and
+            # mc:AlternateContent (text boxes) are not paragraph text
+            # Same mapping as python-docx Run.text
+            for node in child:
+                tag = node.tag
+                if tag == W_T:
+                    parts.append(node.text or "")
+                elif tag == W_TAB or tag == W_PTAB:
+                    parts.append("\t")
+                elif tag == W_CR:
+                    parts.append("\n")
+                elif tag == W_BR:
+                    # Page and column breaks add no text
+                    if node.get(W_TYPE, "textWrapping") == "textWrapping":
+                        parts.append("\n")
+                elif tag == W_NO_BREAK_HYPHEN:
+                    parts.append("-")
+        elif tag == W_HYPERLINK:
+            _collect_run_text(child, parts)
+
+
+def _element_text(element: Any) -> str:
+    """
+    Concatenate the run text of a w:p element in one pass
+    
+    Reads the w:t nodes of its runs directly (tabs and breaks become
+    whitespace) instead of building python-docx Run objects as
+    Paragraph.text does.
+    """
+    parts: List[str] = []
+    _collect_run_text(element, parts)
+    return "".join(parts)
+
+
+def _sniff_image_size(stream: BinaryIO) -> Tuple[int, int]:
+    """
+    Read image dimensions from the header of a PNG, GIF, BMP or JPEG stream
+    
+    Only the leading bytes are read (up to IMAGE_SNIFF_LIMIT for JPEG).
+    
+    Args:
+        stream: Binary stream positioned at the start of the image
+    
+    Returns:
+        (width, height), or (0, 0) if the format or header is not recognised
+    """
+    head = stream.read(26)
+    if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+        return struct.unpack(">II", head[16:24])
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return struct.unpack("<HH", head[6:10])
+    if head[:2] == b"BM" and len(head) == 26:
+        width, height = struct.unpack("<ii", head[18:26])
+        return width, abs(height)  # Negative height means top-down rows
+    if head[:2] != b"\xff\xd8":
+        return 0, 0
+    
+    # JPEG: walk marker segments until a start-of-frame header
+    buf = bytearray(head)
+    pos = 2
+    while pos < IMAGE_SNIFF_LIMIT:
+        if len(buf) < pos + 9:
+            chunk = stream.read(4096)
+            if not chunk:
+                break
+            buf += chunk
+            continue
+        if buf[pos] != 0xFF:
+            break
+        marker = buf[pos + 1]
+        if marker == 0xFF:
+            pos += 1  # Fill byte
+        elif marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack(">HH", buf[pos + 5:pos + 9])
+            return width, height
+        elif marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            pos += 2  # Standalone marker without a length
+        else:
+            pos += 2 + struct.unpack(">H", buf[pos + 2:pos + 4])[0]
+    return 0, 0
+
 
 class DOCXParser(BaseParser):
     """
@@ -66,6 +236,11 @@ class DOCXParser(BaseParser):
             - extract_headers_footers: Extract headers/footers (default: True)
             - preserve_formatting: Track formatting info (default: True)
     
+    With preserve_formatting and extract_tables both off, body text is read
+    straight from the paragraph XML instead of python-docx objects. If
+    extract_headers_footers is off as well, the python-docx Document is never
+    opened and word/document.xml is streamed from the package instead.
+    
     Example:
         >>> parser = DOCXParser("report.docx", {
         ...     "extract_images": True,
@@ -96,12 +271,43 @@ class DOCXParser(BaseParser):
         self.extract_headers_footers = self.options.get("extract_headers_footers", True)
         self.preserve_formatting = self.options.get("preserve_formatting", True)
         
-        # Open DOCX document
+        # Word count of body paragraphs, cached by parse() or _get_word_count()
+        self._word_count: Optional[int] = None
+        
+        # Check the package up front; the python-docx Document (which loads
+        # every part, media included) is only built when something needs it
+        self._doc = None
         try:
-            self.doc = Document(str(self.file_path))
-        except Exception as e:
+            with zipfile.ZipFile(self.file_path) as zf:
+                self._has_main_part = DOCUMENT_PART in zf.NameToInfo
+        except (zipfile.BadZipFile, OSError) as e:
             raise CorruptedFileError(f"Failed to open DOCX: {e}")
     
+    @property
+    def doc(self) -> Any:
+        """python-docx Document, opened on first access"""
+        if self._doc is None:
+            try:
+                self._doc = Document(str(self.file_path))
+            except Exception as e:
+                raise CorruptedFileError(f"Failed to open DOCX: {e}")
+        return self._doc
+    
+    @property
+    def _text_only(self) -> bool:
+        """Whether only plain paragraph text is needed from the body"""
+        return not self.preserve_formatting and not self.extract_tables
+    
+    @property
+    def _use_fast_text(self) -> bool:
+        """Whether body text can be streamed without ever opening the Document"""
+        return (
+            self._text_only
+            and not self.extract_headers_footers
+            and self._doc is None
+            and self._has_main_part
+        )
+    
     def get_page_count(self) -> int:
         """
         Get approximate page count
@@ -109,14 +315,21 @@ class DOCXParser(BaseParser):
         Note: DOCX doesn't have explicit pages, so we estimate
         based on content length (assuming ~500 words per page)
         """
-        word_count = 0
-        for para in self.doc.paragraphs:
-            word_count += len(para.text.split())
-        
         # Estimate pages (500 words per page)
-        pages = max(1, word_count // 500)
+        pages = max(1, self._get_word_count() // 500)
         return pages
     
+    def _get_word_count(self) -> int:
+        """
+        Word count of body paragraphs
+        
+        Uses the count accumulated by parse() when available, otherwise
+        walks the paragraphs once and caches the result.
+        """
+        if self._word_count is None:
+            self._word_count = sum(len(para.text.split()) for para in self.doc.paragraphs)
+        return self._word_count
+    
     async def validate(self) -> tuple[bool, Optional[str]]:
         """
         Validate DOCX file
@@ -124,19 +337,33 @@ class DOCXParser(BaseParser):
         Returns:
             Tuple of (is_valid, error_message)
         """
+        # Opening the Document (media included) blocks, so do it off the loop
+        return await asyncio.to_thread(self._validate_sync)
+    
+    def _validate_sync(self) -> tuple[bool, Optional[str]]:
+        """Blocking body of validate()"""
         try:
+            # Plain-text parsing never builds the object model; the package
+            # itself was checked when the parser was created
+            if self._use_fast_text:
+                if not self._body_has_content():
+                    return False, "DOCX has no content"
+                return True, None
+            
             # Check if document can be opened
-            if not hasattr(self, 'doc'):
-                return False, "Failed to open DOCX document"
+            try:
+                doc = self.doc
+            except CorruptedFileError as e:
+                return False, str(e)
             
             # Check if has content
-            if not self.doc.paragraphs and not self.doc.tables:
+            if not doc.paragraphs and not doc.tables:
                 return False, "DOCX has no content"
             
             # Try to read first paragraph
             try:
-                if self.doc.paragraphs:
-                    _ = self.doc.paragraphs[0].text
+                if doc.paragraphs:
+                    _ = doc.paragraphs[0].text
             except Exception as e:
                 return False, f"Failed to read DOCX content: {e}"
             
@@ -149,15 +376,22 @@ class DOCXParser(BaseParser):
         """
         Parse entire DOCX document
         
+        Runs the python-docx work in a worker thread so the event loop
+        stays responsive.
+        
         Returns:
             ParserResult with parsed content
         """
+        return await asyncio.to_thread(self._parse_sync)
+    
+    def _parse_sync(self) -> ParserResult:
+        """Blocking body of parse()"""
         start_time = time.time()
         warnings = []
         
         try:
             # Validate first
-            is_valid, error = await self.validate()
+            is_valid, error = self._validate_sync()
             if not is_valid:
                 return ParserResult(
                     document=None,
@@ -166,49 +400,67 @@ class DOCXParser(BaseParser):
                     file_size=self.file_size
                 )
             
-            # Extract metadata
-            metadata = self._extract_metadata()
-            
             # Parse content
             sections = []
             images = []
             tables = []
-            full_text = []
+            full_text = io.StringIO()  # Blocks, each followed by a blank line
+            word_count = 0
             
             # Extract headers/footers
             if self.extract_headers_footers:
                 header_footer_text = self._extract_headers_footers()
                 if header_footer_text:
-                    full_text.append(f"--- Headers/Footers ---\n{header_footer_text}")
+                    full_text.write(f"--- Headers/Footers ---\n{header_footer_text}\n\n")
             
             # Process document body
-            for element in self.doc.element.body:
-                if isinstance(element, CT_P):
-                    # Paragraph
-                    para = Paragraph(element, self.doc)
-                    section_data = self._parse_paragraph(para)
-                    
-                    if section_data["text"]:
-                        sections.append(section_data)
-                        full_text.append(section_data["text"])
-                
-                elif isinstance(element, CT_Tbl):
-                    # Table
-                    if self.extract_tables:
-                        table = Table(element, self.doc)
-                        table_data = self._parse_table(table, len(tables))
+            if self._text_only:
+                # Plain paragraph text only: stream document.xml directly, or
+                # read the already-loaded body XML without Paragraph objects
+                texts = self._parse_fast_text() if self._use_fast_text else self._body_texts()
+                for text in texts:
+                    sections.append({"text": text, "style": None, "formatting": {}})
+                    full_text.write(text)
+                    full_text.write("\n\n")
+                    word_count += len(text.split())
+            else:
+                for element in self.doc.element.body:
+                    if isinstance(element, CT_P):
+                        # Paragraph
+                        para = Paragraph(element, self.doc)
+                        section_data = self._parse_paragraph(para)
                         
-                        # Only append if table is valid (not None)
-                        if table_data is not None:
-                            tables.append(table_data)
+                        if section_data["text"]:
+                            sections.append(section_data)
+                            full_text.write(section_data["text"])
+                            full_text.write("\n\n")
+                            word_count += len(section_data["text"].split())
+                    
+                    elif isinstance(element, CT_Tbl):
+                        # Table
+                        if self.extract_tables:
+                            table = Table(element, self.doc)
+                            table_data = self._parse_table(table, len(tables))
                             
-                            # Add table text to full text
-                            table_text = self._table_to_text(table_data)
-                            full_text.append(table_text)
+                            # Only append if table is valid (not None)
+                            if table_data is not None:
+                                tables.append(table_data)
+                                
+                                # Add table text to full text
+                                self._write_table_text(table_data, full_text)
+                                full_text.write("\n\n")
             
-            # Extract images
+            # Body walk above also counted words; metadata reuses it
+            self._word_count = word_count
+            metadata = self._extract_metadata()
+            
+            # Extract images (straight from the package if the object model
+            # was never needed)
             if self.extract_images:
-                images = self._extract_images()
+                if self._doc is None:
+                    images = self._extract_package_images()
+                else:
+                    images = self._extract_images()
             
             # Create pages (treat each section as a page for compatibility)
             pages = []
@@ -221,12 +473,16 @@ class DOCXParser(BaseParser):
                 )
                 pages.append(page_info)
             
+            # Drop the separator after the last block
+            if full_text.tell():
+                full_text.truncate(full_text.tell() - 2)
+            
             # Create ParsedDocument
             document = ParsedDocument(
                 file_path=str(self.file_path),
                 file_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 file_size=self.file_size,
-                text="\n\n".join(full_text),
+                text=full_text.getvalue(),
                 metadata=metadata,
                 pages=pages,
                 images=images,
@@ -256,13 +512,15 @@ class DOCXParser(BaseParser):
         """
         Parse DOCX in streaming mode
         
-        Yields document elements as they are parsed.
+        Yields document elements as they are parsed. Body elements are
+        converted on a worker thread that runs ahead of the consumer through
+        a bounded queue.
         """
         section_num = 0
         
         # Headers/footers
         if self.extract_headers_footers:
-            header_footer_text = self._extract_headers_footers()
+            header_footer_text = await asyncio.to_thread(self._extract_headers_footers)
             if header_footer_text:
                 yield DocumentElement(
                     type=ElementType.TEXT,
@@ -271,14 +529,98 @@ class DOCXParser(BaseParser):
                 )
         
         # Process document body
-        for element in self.doc.element.body:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        stop = threading.Event()
+        producer = asyncio.ensure_future(
+            asyncio.to_thread(self._produce_body_elements, loop, queue, stop)
+        )
+        
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    break
+                if isinstance(batch, BaseException):
+                    raise batch
+                for element in batch:
+                    yield element
+        finally:
+            # Unblock a producer waiting on a full queue, then let it exit
+            stop.set()
+            while not queue.empty():
+                queue.get_nowait()
+            await producer
+        
+        # Images
+        if self.extract_images:
+            images = await asyncio.to_thread(self._extract_images)
+            for image in images:
+                yield DocumentElement(
+                    type=ElementType.IMAGE,
+                    content=None,
+                    metadata={"image_info": image}
+                )
+    
+    def _produce_body_elements(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        queue: asyncio.Queue,
+        stop: threading.Event
+    ) -> None:
+        """
+        Convert body elements in batches and hand them to parse_stream
+        
+        Runs on a worker thread. Puts lists of DocumentElements on the queue,
+        then None when done (or the exception that stopped it).
+        """
+        def put(item: Any) -> None:
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+        
+        try:
+            body = list(self.doc.element.body)
+            section_num = 0
+            for start in range(0, len(body), STREAM_BATCH_SIZE):
+                if stop.is_set():
+                    return
+                elements, section_num = self._parse_chunk(
+                    body[start:start + STREAM_BATCH_SIZE], section_num
+                )
+                if elements:
+                    put(elements)
+        except Exception as e:
+            if not stop.is_set():
+                put(e)
+            return
+        
+        if not stop.is_set():
+            put(None)
+    
+    def _parse_chunk(
+        self,
+        body_elements: List[Any],
+        section_num: int
+    ) -> tuple[List[DocumentElement], int]:
+        """
+        Convert a batch of body elements for parse_stream
+        
+        Args:
+            body_elements: CT_P / CT_Tbl elements from the document body
+            section_num: Section number of the first element
+        
+        Returns:
+            Tuple of (document elements, next section number)
+        """
+        elements = []
+        
+        for element in body_elements:
             if isinstance(element, CT_P):
                 # Paragraph
                 para = Paragraph(element, self.doc)
                 section_data = self._parse_paragraph(para)
                 
                 if section_data["text"]:
-                    yield DocumentElement(
+                    elements.append(DocumentElement(
                         type=ElementType.TEXT,
                         content=section_data["text"],
                         metadata={
@@ -286,7 +628,7 @@ class DOCXParser(BaseParser):
                             "style": section_data.get("style"),
                             "formatting": section_data.get("formatting", {})
                         }
-                    )
+                    ))
                     section_num += 1
             
             elif isinstance(element, CT_Tbl):
@@ -295,28 +637,70 @@ class DOCXParser(BaseParser):
                     table = Table(element, self.doc)
                     table_data = self._parse_table(table, section_num)
                     
-                    yield DocumentElement(
+                    elements.append(DocumentElement(
                         type=ElementType.TABLE,
                         content=None,
                         metadata={
                             "section": section_num,
                             "table_info": table_data
                         }
-                    )
+                    ))
                     section_num += 1
-            
-            # Yield control to event loop
-            await asyncio.sleep(0)
         
-        # Images
-        if self.extract_images:
-            images = self._extract_images()
-            for image in images:
-                yield DocumentElement(
-                    type=ElementType.IMAGE,
-                    content=None,
-                    metadata={"image_info": image}
-                )
+        return elements, section_num
+    
+    def _body_has_content(self) -> bool:
+        """Whether word/document.xml has a body-level paragraph or table"""
+        with zipfile.ZipFile(self.file_path) as zf, zf.open(DOCUMENT_PART) as f:
+            for _, elem in etree.iterparse(f, events=("start",), tag=(W_P, W_TBL)):
+                parent = elem.getparent()
+                if parent is not None and parent.tag == W_BODY:
+                    return True
+        return False
+    
+    def _parse_fast_text(self) -> List[str]:
+        """
+        Extract body paragraph text with lxml.iterparse
+        
+        Streams word/document.xml without building python-docx objects,
+        clearing each top-level element once handled so memory stays flat.
+        
+        Returns:
+            Stripped, non-empty text of each top-level body paragraph
+        """
+        texts = []
+        
+        with zipfile.ZipFile(self.file_path) as zf, zf.open(DOCUMENT_PART) as f:
+            for _, elem in etree.iterparse(f, events=("end",), tag=(W_P, W_TBL)):
+                parent = elem.getparent()
+                if parent is None or parent.tag != W_BODY:
+                    continue  # Nested in a table/text box; freed with its ancestor
+                
+                if elem.tag == W_P:
+                    text = _element_text(elem).strip()
+                    if text:
+                        texts.append(text)
+                
+                # Free the handled element and everything before it
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+        
+        return texts
+    
+    def _body_texts(self) -> List[str]:
+        """
+        Extract body paragraph text from the loaded Document's XML
+        
+        Returns:
+            Stripped, non-empty text of each top-level body paragraph
+        """
+        texts = []
+        for element in self.doc.element.body.iterchildren(W_P):
+            text = _element_text(element).strip()
+            if text:
+                texts.append(text)
+        return texts
     
     def _parse_paragraph(self, para: Any) -> Dict[str, Any]:
         """
@@ -328,7 +712,7 @@ class DOCXParser(BaseParser):
         Returns:
             Dict with text, style, and formatting info
         """
-        text = para.text.strip()
+        text = _element_text(para._p).strip()
         
         if not text:
             return {"text": "", "style": None, "formatting": {}}
@@ -340,10 +724,14 @@ class DOCXParser(BaseParser):
         formatting = {}
         
         if self.preserve_formatting:
-            # Check for bold, italic, underline in runs
-            has_bold = any(run.bold for run in para.runs if run.bold)
-            has_italic = any(run.italic for run in para.runs if run.italic)
-            has_underline = any(run.underline for run in para.runs if run.underline)
+            # Check for bold, italic, underline in a single pass over runs
+            has_bold = has_italic = has_underline = False
+            for run in para.runs:
+                has_bold = has_bold or bool(run.bold)
+                has_italic = has_italic or bool(run.italic)
+                has_underline = has_underline or bool(run.underline)
+                if has_bold and has_italic and has_underline:
+                    break
             
             formatting = {
                 "bold": has_bold,
@@ -372,12 +760,21 @@ class DOCXParser(BaseParser):
         try:
             rows = []
             
-            for row in table.rows:
+            # Walk w:tr/w:tc directly instead of building _Cell proxies via
+            # row.cells; merged cells repeat their text like row.cells does
+            above: List[str] = []
+            for tr in table._tbl.iterchildren(W_TR):
                 cells = []
-                for cell in row.cells:
-                    cell_text = cell.text.strip()
-                    cells.append(cell_text)
+                for tc in tr.iterchildren(W_TC):
+                    if tc.vMerge == "continue" and len(cells) < len(above):
+                        cell_text = above[len(cells)]
+                    else:
+                        cell_text = "\n".join(
+                            _element_text(p) for p in tc.iterchildren(W_P)
+                        ).strip()
+                    cells.extend([cell_text] * tc.grid_span)
                 rows.append(cells)
+                above = cells
             
             # Use safe creation helper from BaseParser
             return self._create_table_info_safe(
@@ -393,30 +790,24 @@ class DOCXParser(BaseParser):
             print(f"Warning: Failed to parse table {table_index}: {e}")
             return None
     
-    def _table_to_text(self, table_info: TableInfo) -> str:
+    def _write_table_text(self, table_info: TableInfo, out: io.StringIO) -> None:
         """
-        Convert table to text representation
+        Write the text representation of a table into a buffer
         
         Args:
             table_info: TableInfo object
-        
-        Returns:
-            Text representation of table
+            out: Buffer to write into
         """
-        lines = []
-        
         # All rows (first row is typically headers)
         if table_info.rows:
             # First row as headers
-            if len(table_info.rows) > 0:
-                lines.append(" | ".join(table_info.rows[0]))
-                lines.append("-" * 50)
+            out.write(" | ".join(table_info.rows[0]))
+            out.write("\n" + "-" * 50)
             
             # Data rows
             for row in table_info.rows[1:]:
-                lines.append(" | ".join(str(cell) for cell in row))
-        
-        return "\n".join(lines)
+                out.write("\n")
+                out.write(" | ".join(map(str, row)))
     
     def _extract_images(self) -> List[ImageInfo]:
         """
@@ -432,33 +823,27 @@ class DOCXParser(BaseParser):
             rels = self.doc.part.rels
             
             image_index = 0
-            for rel_id, rel in rels.items():
-                if "image" in rel.target_ref:
+            for rel in rels.values():
+                # Linked (external) images have no part to read
+                if rel.reltype == RT.IMAGE and not rel.is_external:
                     try:
                         # Get image data
                         image_part = rel.target_part
                         image_data = image_part.blob
                         
                         # Get format from content type
-                        content_type = image_part.content_type
-                        format_map = {
-                            "image/jpeg": "jpg",
-                            "image/png": "png",
-                            "image/gif": "gif",
-                            "image/bmp": "bmp",
-                            "image/tiff": "tiff"
-                        }
-                        image_format = format_map.get(content_type, "unknown")
+                        image_format = _IMAGE_FORMATS.get(image_part.content_type, "unknown")
+                        width, height = _sniff_image_size(io.BytesIO(image_data))
                         
                         # Create ImageInfo using safe helper
                         image_info = self._create_image_info_safe(
                             image_id=f"docx_image_{image_index}",
                             format=image_format,
-                            width=0,  # Unknown - python-docx doesn't provide dimensions easily
-                            height=0,  # Unknown
+                            width=width,
+                            height=height,
                             page_number=1,  # Unknown in DOCX
                             data=image_data,
-                            max_image_size=10 * 1024 * 1024  # 10MB limit
+                            max_image_size=MAX_IMAGE_SIZE
                         )
                         
                         # Only append if image is valid (not None)
@@ -512,26 +897,22 @@ class DOCXParser(BaseParser):
             DocumentMetadata object
         """
         try:
-            core_props = self.doc.core_properties
-            
-            # Get dates
-            created_date = core_props.created if hasattr(core_props, 'created') else None
-            modified_date = core_props.modified if hasattr(core_props, 'modified') else None
-            
-            # Word count
-            word_count = 0
-            for para in self.doc.paragraphs:
-                word_count += len(para.text.split())
+            if self._doc is None:
+                # Read docProps/core.xml directly rather than opening the Document
+                props = self._read_core_properties()
+            else:
+                core_props = self.doc.core_properties
+                props = {name: getattr(core_props, name, None) for name in _CORE_PROPERTIES}
             
             return self._create_metadata(
-                title=core_props.title if hasattr(core_props, 'title') else None,
-                author=core_props.author if hasattr(core_props, 'author') else None,
-                created_date=created_date,
-                modified_date=modified_date,
+                title=props["title"],
+                author=props["author"],
+                created_date=props["created"],
+                modified_date=props["modified"],
                 page_count=self.get_page_count(),
-                subject=core_props.subject if hasattr(core_props, 'subject') else None,
-                keywords=core_props.keywords if hasattr(core_props, 'keywords') else None,
-                word_count=word_count
+                subject=props["subject"],
+                keywords=props["keywords"],
+                word_count=self._get_word_count()
             )
         
         except Exception as e:
@@ -540,6 +921,121 @@ class DOCXParser(BaseParser):
                 page_count=self.get_page_count()
             )
     
+    def _read_core_properties(self) -> Dict[str, Any]:
+        """
+        Read core document properties from the package without python-docx
+        
+        Returns:
+            Dict with title, author, created, modified, subject and keywords
+        """
+        props: Dict[str, Any] = dict.fromkeys(_CORE_PROPERTIES)
+        
+        with zipfile.ZipFile(self.file_path) as zf:
+            try:
+                data = zf.read(CORE_PROPS_PART)
+            except KeyError:
+                return props
+        
+        root = etree.fromstring(data)
+        for name, tag in _CORE_PROPERTIES.items():
+            node = root.find(tag)
+            if node is not None and node.text:
+                props[name] = node.text
+        
+        # Dates are W3CDTF in UTC; python-docx returns them naive
+        for name in ("created", "modified"):
+            if props[name]:
+                try:
+                    props[name] = datetime.fromisoformat(props[name]).replace(tzinfo=None)
+                except ValueError:
+                    props[name] = None
+        
+        return props
+    
+    def _extract_package_images(self) -> List[ImageInfo]:
+        """
+        Extract the main document's images by reading them from the package
+        
+        Used when the python-docx Document was never opened, so media parts
+        are read one entry at a time instead of all at load. Images are the
+        targets of word/document.xml's image relationships, in relationship
+        order, matching _extract_images.
+        
+        Returns:
+            List of ImageInfo objects
+        """
+        images = []
+        
+        try:
+            with zipfile.ZipFile(self.file_path) as zf:
+                for part_name in self._package_image_parts(zf):
+                    image_index = len(images)
+                    try:
+                        info = zf.getinfo(part_name)
+                        image_format = _MEDIA_FORMATS.get(
+                            posixpath.splitext(part_name)[1].lower(), "unknown"
+                        )
+                        
+                        # Dimensions come from the header; only images under
+                        # the size cap are decompressed in full
+                        with zf.open(info) as f:
+                            width, height = _sniff_image_size(f)
+                        image_data = zf.read(info) if info.file_size <= MAX_IMAGE_SIZE else None
+                        
+                        image_info = self._create_image_info_safe(
+                            image_id=f"docx_image_{image_index}",
+                            format=image_format,
+                            width=width,
+                            height=height,
+                            page_number=1,  # Unknown in DOCX
+                            data=image_data,
+                            max_image_size=MAX_IMAGE_SIZE
+                        )
+                        
+                        # Only append if image is valid (not None)
+                        if image_info is not None:
+                            images.append(image_info)
+                    
+                    except Exception as e:
+                        print(f"Warning: Failed to extract image {image_index}: {e}")
+                        continue
+        
+        except Exception as e:
+            print(f"Warning: Failed to extract images: {e}")
+        
+        return images
+    
+    @staticmethod
+    def _package_image_parts(zf: zipfile.ZipFile) -> List[str]:
+        """
+        Resolve the image relationship targets of word/document.xml
+        
+        Args:
+            zf: Open DOCX package
+        
+        Returns:
+            Package part names of internal images, in relationship order
+        """
+        try:
+            data = zf.read(DOCUMENT_RELS_PART)
+        except KeyError:
+            return []
+        
+        base = posixpath.dirname(DOCUMENT_PART)
+        part_names = []
+        for rel in etree.fromstring(data).iter(_PR_RELATIONSHIP):
+            if rel.get("Type") != RT.IMAGE or rel.get("TargetMode") == "External":
+                continue
+            
+            # Targets are relative to word/ unless they start with "/"
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                part_names.append(target[1:])
+            else:
+                part_names.append(posixpath.normpath(posixpath.join(base, target)))
+        
+        return part_names
+    
     def get_supported_features(self) -> Dict[str, bool]:
         """Get supported features"""
         return {
@@ -4,13 +4,72 @@ Parser Factory - Auto-detect and instantiate appropriate parser
 Automatically selects the right parser based on file type.
 """
 
+import asyncio
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Type
 
-from .base import BaseParser, UnsupportedFormatError
+from .base import BaseParser, ParserResult, UnsupportedFormatError
 from ..models.enums import DocumentType
 
 
+# File extension -> parser type
+_EXT_TO_TYPE: Dict[str, str] = {
+    '.pdf': 'pdf',
+    '.doc': 'docx',
+    '.docx': 'docx',
+    '.ppt': 'pptx',
+    '.pptx': 'pptx',
+    '.xls': 'xlsx',
+    '.xlsx': 'xlsx',
+    '.jpg': 'image',
+    '.jpeg': 'image',
+    '.png': 'image',
+    '.gif': 'image',
+    '.bmp': 'image',
+    '.tiff': 'image',
+    '.txt': 'text',
+    '.md': 'text',
+    '.rst': 'text',
+    '.html': 'html',
+    '.htm': 'html',
+    '.csv': 'csv',
+}
+
+# Alternative names accepted for parser_type
+_TYPE_ALIASES: Dict[str, str] = {
+    'word': 'docx',
+    'doc': 'docx',
+    'powerpoint': 'pptx',
+    'ppt': 'pptx',
+    'excel': 'xlsx',
+    'xls': 'xlsx',
+}
+
+# Parser type -> (module relative to this package, class name)
+_PARSER_CLASSES: Dict[str, Tuple[str, str]] = {
+    'pdf': ('.pdf', 'PDFParser'),
+    'docx': ('.docx', 'DOCXParser'),
+    'pptx': ('.pptx', 'PPTXParser'),
+    'xlsx': ('.xlsx', 'XLSXParser'),
+    'image': ('.image', 'ImageParser'),
+    'text': ('.text', 'TextParser'),
+    'html': ('.html', 'HTMLParser'),
+    'csv': ('.csv', 'CSVParser'),
+}
+
+
+@lru_cache(maxsize=None)
+def _load_parser_class(parser_type: str) -> Type[BaseParser]:
+    """Import a parser module on first use and return its parser class"""
+    module_name, class_name = _PARSER_CLASSES[parser_type]
+    return getattr(importlib.import_module(module_name, __package__), class_name)
+
+
 def get_parser(
     file_path: str | Path,
     parser_type: Optional[str] = None,
@@ -44,69 +103,70 @@ def get_parser(
     # Detect file type if not specified
     if parser_type is None:
         ext = file_path.suffix.lower()
-        
-        if ext == '.pdf':
-            parser_type = 'pdf'
-        elif ext in ['.doc', '.docx']:
-            parser_type = 'docx'
-        elif ext in ['.ppt', '.pptx']:
-            parser_type = 'pptx'
-        elif ext in ['.xls', '.xlsx']:
-            parser_type = 'xlsx'
-        elif ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff']:
-            parser_type = 'image'
-        elif ext in ['.txt', '.md', '.rst']:
-            parser_type = 'text'
-        elif ext in ['.html', '.htm']:
-            parser_type = 'html'
-        elif ext == '.csv':
-            parser_type = 'csv'
-        else:
+        parser_type = _EXT_TO_TYPE.get(ext)
+        if parser_type is None:
             raise UnsupportedFormatError(
                 f"Unsupported file format: {ext}\n"
                 f"Supported formats: .pdf, .docx, .pptx, .xlsx, .jpg, .png, .txt, .html, .csv"
             )
     
-    # Import and instantiate appropriate parser
+    # Import (once) and instantiate appropriate parser
     parser_type = parser_type.lower()
+    parser_type = _TYPE_ALIASES.get(parser_type, parser_type)
     
-    if parser_type == 'pdf':
-        from .pdf import PDFParser
-        return PDFParser(file_path, options)
+    if parser_type not in _PARSER_CLASSES:
+        raise UnsupportedFormatError(
+            f"Unknown parser type: {parser_type}\n"
+            f"Supported types: pdf, docx, pptx, xlsx, image, text, html, csv"
+        )
     
-    elif parser_type in ['docx', 'word', 'doc']:
-        from .docx import DOCXParser
-        return DOCXParser(file_path, options)
+    return _load_parser_class(parser_type)(file_path, options)
+
+
+def _parse_one(file_path: Path, options: Optional[Dict[str, Any]]) -> ParserResult:
+    """Parse a single file in a worker process, reporting failures as results"""
+    try:
+        parser = get_parser(file_path, options=options)
+        return asyncio.run(parser.parse())
+    except Exception as e:
+        return ParserResult(document=None, success=False, error=str(e))
+
+
+def parse_many(
+    file_paths: Sequence[str | Path],
+    options: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = None
+) -> List[ParserResult]:
+    """
+    Parse many documents in parallel worker processes
     
-    elif parser_type in ['pptx', 'powerpoint', 'ppt']:
-        from .pptx import PPTXParser
-        return PPTXParser(file_path, options)
+    Parsers such as python-docx are CPU-bound pure Python, so processes
+    (not threads or asyncio) are what give real parallelism here.
     
-    elif parser_type in ['xlsx', 'excel', 'xls']:
-        from .xlsx import XLSXParser
-        return XLSXParser(file_path, options)
+    Args:
+        file_paths: Documents to parse
+        options: Parser-specific options, shared by every file
+        workers: Worker process count (default: CPU count)
     
-    elif parser_type == 'image':
-        from .image import ImageParser
-        return ImageParser(file_path, options)
+    Returns:
+        One ParserResult per path, in input order; files that cannot be
+        opened come back with success=False
     
-    elif parser_type == 'text':
-        from .text import TextParser
-        return TextParser(file_path, options)
+    Example:
+        >>> results = parse_many(["a.docx", "b.pdf", "c.csv"])
+        >>> failed = [r for r in results if not r.success]
+    """
+    file_paths = [Path(p) for p in file_paths]
+    if not file_paths:
+        return []
     
-    elif parser_type == 'html':
-        from .html import HTMLParser
-        return HTMLParser(file_path, options)
+    workers = workers or os.cpu_count() or 1
     
-    elif parser_type == 'csv':
-        from .csv import CSVParser
-        return CSVParser(file_path, options)
+    # A few chunks per worker amortizes task queueing without starving the pool
+    chunksize = max(1, len(file_paths) // (4 * workers))
     
-    else:
-        raise UnsupportedFormatError(
-            f"Unknown parser type: {parser_type}\n"
-            f"Supported types: pdf, docx, pptx, xlsx, image, text, html, csv"
-        )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_one, file_paths, repeat(options), chunksize=chunksize))
 
 
 def get_supported_formats() -> Dict[str, list[str]]:
@@ -138,11 +198,4 @@ def is_supported(file_path: str | Path) -> bool:
     Returns:
         True if format is supported
     """
-    ext = Path(file_path).suffix.lower()
-    supported = get_supported_formats()
-    
-    for formats in supported.values():
-        if ext in formats:
-            return True
-    
-    return False
+    return Path(file_path).suffix.lower() in _EXT_TO_TYPE